@@ -45,10 +45,7 @@ class AppConfig:
     
     # Auto Game Flow settings
     game_flow_check_interval: int = 1  # seconds between checks
-    countdown_broadcast_interval: int = 15  # seconds between countdown updates
     room_status_broadcast_interval: int = 60  # seconds between room status broadcasts
-    warning_threshold_seconds: int = 30  # seconds for first warning
-    final_warning_threshold_seconds: int = 10  # seconds for final warning
     room_cleanup_inactive_minutes: int = 60  # minutes before cleaning up inactive rooms
     
     # Rate Limiting settings
@@ -103,15 +100,6 @@ class AppConfig:
         if self.game_flow_check_interval < 1 or self.game_flow_check_interval > 60:
             raise ConfigError(f"Invalid game_flow_check_interval: {self.game_flow_check_interval}")
         
-        if self.countdown_broadcast_interval < 1 or self.countdown_broadcast_interval > 300:
-            raise ConfigError(f"Invalid countdown_broadcast_interval: {self.countdown_broadcast_interval}")
-        
-        if self.warning_threshold_seconds < 1 or self.warning_threshold_seconds > 300:
-            raise ConfigError(f"Invalid warning_threshold_seconds: {self.warning_threshold_seconds}")
-        
-        if self.final_warning_threshold_seconds < 1 or self.final_warning_threshold_seconds >= self.warning_threshold_seconds:
-            raise ConfigError(f"Invalid final_warning_threshold_seconds: {self.final_warning_threshold_seconds}")
-        
         # Rate Limiting validations
         if self.max_events_per_client_queue < 1 or self.max_events_per_client_queue > 1000:
             raise ConfigError(f"Invalid max_events_per_client_queue: {self.max_events_per_client_queue}")
@@ -237,10 +225,7 @@ class ConfigurationFactory:
             
             # Auto Game Flow settings
             game_flow_check_interval=get_env_var('GAME_FLOW_CHECK_INTERVAL', 1, int),
-            countdown_broadcast_interval=get_env_var('COUNTDOWN_BROADCAST_INTERVAL', 10, int),
             room_status_broadcast_interval=get_env_var('ROOM_STATUS_BROADCAST_INTERVAL', 60, int),
-            warning_threshold_seconds=get_env_var('WARNING_THRESHOLD_SECONDS', 30, int),
-            final_warning_threshold_seconds=get_env_var('FINAL_WARNING_THRESHOLD_SECONDS', 10, int),
             room_cleanup_inactive_minutes=get_env_var('ROOM_CLEANUP_INACTIVE_MINUTES', 60, int),
             
             # Rate Limiting settings
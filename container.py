@@ -194,19 +194,16 @@ class ServiceContainer:
             ServiceNotFoundError: If service is not registered
             CircularDependencyError: If circular dependency detected
         """
-        # Check for external dependency first
-        if name in self._instances:
+        # External dependencies and already-created singletons are served with a
+        # single dict lookup, since handlers resolve services on every event
+        try:
             return self._instances[name]
+        except KeyError:
+            pass
         
         if name not in self._services:
             raise ServiceNotFoundError(f"Service '{name}' is not registered")
         
-        service_def = self._services[name]
-        
-        # Check for singleton instance
-        if service_def.lifecycle == ServiceLifecycle.SINGLETON and name in self._instances:
-            return self._instances[name]
-        
         # Create new instance
         return self._create_service(name)
     
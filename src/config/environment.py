@@ -0,0 +1,32 @@
+"""
+Runtime Environment Detection
+
+Shared check for whether the process is running under a test harness.
+"""
+
+import os
+import sys
+from functools import lru_cache
+
+
+@lru_cache(maxsize=None)
+def is_testing() -> bool:
+    """
+    Check whether we're running in a testing environment.
+
+    The result is computed on first use and cached, since the checks below
+    walk sys.modules and sys.argv. Code that changes the environment
+    afterwards (e.g. a test toggling TESTING) must call
+    ``is_testing.cache_clear()`` for the change to be picked up.
+
+    Returns:
+        True if running under tests, False otherwise
+    """
+    return (
+        os.environ.get('TESTING') == '1' or
+        'pytest' in os.environ.get('_', '') or
+        'PYTEST_CURRENT_TEST' in os.environ or
+        'pytest' in sys.modules or
+        any('pytest' in arg for arg in sys.argv) or
+        bool(sys.argv) and 'test' in sys.argv[0].lower()
+    )
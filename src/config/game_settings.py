@@ -7,10 +7,13 @@ replacing hardcoded constants throughout the codebase.
 
 import logging
 from typing import Dict
+from src.config.environment import is_testing
 from src.core.game_phases import GamePhase
 
 logger = logging.getLogger(__name__)
 
+_TESTING_REQUEST_WINDOW = 0.01  # Much shorter window for tests
+
 
 class GameSettings:
     """Centralized game settings management."""
@@ -74,22 +77,11 @@ class GameSettings:
         Returns:
             Time window for request deduplication
         """
-        if self._config is None:
-            # Check for testing environment manually as fallback
-            import os
-            is_testing = os.environ.get('TESTING') == '1' or 'pytest' in os.environ.get('_', '')
-            return 0.01 if is_testing else 1.0
+        if is_testing():
+            return _TESTING_REQUEST_WINDOW
         
-        # In testing mode, use shorter window
-        import os
-        is_testing = (
-            os.environ.get('TESTING') == '1' or 
-            'pytest' in os.environ.get('_', '') or
-            'pytest' in str(os.environ.get('PYTEST_CURRENT_TEST', ''))
-        )
-        
-        if is_testing:
-            return 0.01  # Much shorter window for tests
+        if self._config is None:
+            return 1.0  # Fallback default
         
         return self._config.request_dedup_window_seconds
     
@@ -7,7 +7,7 @@ prompts, responses, and model information for the guessing game.
 
 import yaml
 import random
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass
 import logging
 
@@ -62,6 +62,8 @@ class ContentManager:
         """
         self.yaml_file_path = yaml_file_path
         self.prompts: List[PromptData] = []
+        self._prompts_by_id: Dict[str, PromptData] = {}
+        self._prompts_view: Tuple[PromptData, ...] = ()
         self._loaded = False
     
     def load_prompts_from_yaml(self) -> None:
@@ -79,6 +81,8 @@ class ContentManager:
             
             self.validate_yaml_structure(data)
             self.prompts = self._parse_prompts(data)
+            self._prompts_by_id = {prompt.id: prompt for prompt in self.prompts}
+            self._prompts_view = tuple(self.prompts)
             self._loaded = True
             logger.info(f"Successfully loaded {len(self.prompts)} prompts from {self.yaml_file_path}")
             
@@ -218,18 +222,14 @@ class ContentManager:
         if not self._loaded:
             raise RuntimeError("No prompts loaded. Call load_prompts_from_yaml() first.")
         
-        for prompt in self.prompts:
-            if prompt.id == prompt_id:
-                return prompt
-        
-        return None
+        return self._prompts_by_id.get(prompt_id)
     
-    def get_all_prompts(self) -> List[PromptData]:
+    def get_all_prompts(self) -> Tuple[PromptData, ...]:
         """
         Get all loaded prompts.
         
         Returns:
-            List of all PromptData objects
+            Immutable tuple of all PromptData objects, shared between calls
             
         Raises:
             RuntimeError: If no prompts are loaded
@@ -237,7 +237,7 @@ class ContentManager:
         if not self._loaded:
             raise RuntimeError("No prompts loaded. Call load_prompts_from_yaml() first.")
         
-        return self.prompts.copy()
+        return self._prompts_view
     
     def is_loaded(self) -> bool:
         """Check if prompts have been loaded."""
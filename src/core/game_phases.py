@@ -12,4 +12,9 @@ class GamePhase(Enum):
     WAITING = "waiting"
     RESPONDING = "responding"
     GUESSING = "guessing"
-    RESULTS = "results"
\ No newline at end of file
+    RESULTS = "results"
+
+
+# Phase value sets for membership tests against the string stored in game_state
+ROUND_START_PHASES = frozenset({GamePhase.WAITING.value, GamePhase.RESULTS.value})
+PROMPT_PHASES = frozenset({GamePhase.RESPONDING.value, GamePhase.GUESSING.value, GamePhase.RESULTS.value})
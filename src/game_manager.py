@@ -12,11 +12,11 @@ import random
 try:
     from .room_manager import RoomManager
     from .config.game_settings import get_game_settings
-    from .core.game_phases import GamePhase
+    from .core.game_phases import GamePhase, ROUND_START_PHASES
 except ImportError:
     from src.room_manager import RoomManager
     from src.config.game_settings import get_game_settings
-    from src.core.game_phases import GamePhase
+    from src.core.game_phases import GamePhase, ROUND_START_PHASES
 
 
 class GameManager:
@@ -46,7 +46,7 @@ class GameManager:
         
         # Can only start new round from waiting or results phase
         current_phase = room["game_state"]["phase"]
-        if current_phase not in ["waiting", "results"]:
+        if current_phase not in ROUND_START_PHASES:
             return False
         
         # Update game state for new round
@@ -217,20 +217,33 @@ class GameManager:
         if not room:
             return GamePhase.WAITING.value
         
-        # Calculate and update scores
-        self._calculate_round_scores(room_id, room)
+        # The room snapshot shares its players and game state with the live room,
+        # so work on copies until the phase transition has been accepted
+        players = {player_id: dict(player_data) for player_id, player_data in room["players"].items()}
+        self._calculate_round_scores(room_id, {**room, "players": players})
         
-        # Update phase
-        room["game_state"]["phase"] = GamePhase.RESULTS.value
-        room["game_state"]["phase_start_time"] = datetime.now()
-        room["game_state"]["phase_duration"] = self.PHASE_DURATIONS[GamePhase.RESULTS]
+        game_state = {
+            **room["game_state"],
+            "phase": GamePhase.RESULTS.value,
+            "phase_start_time": datetime.now(),
+            "phase_duration": self.PHASE_DURATIONS[GamePhase.RESULTS]
+        }
         
-        # Update game state in room manager
-        self.room_manager.update_game_state(room_id, room["game_state"])
+        # Phase changes go through the validated path; scores are only written
+        # once the transition has been accepted
+        if not self.room_manager.update_game_state(room_id, game_state):
+            return GamePhase.RESULTS.value
+        
+        scores = {player_id: player_data["score"] for player_id, player_data in players.items()}
+        
+        def apply_round_scores(live_room: Dict) -> None:
+            live_players = live_room["players"]
+            for player_id, score in scores.items():
+                if player_id in live_players:
+                    live_players[player_id]["score"] = score
         
-        # Update player scores in room manager
-        for player_id, player_data in room["players"].items():
-            self.room_manager.update_player_score(room_id, player_id, player_data["score"])
+        # Update all player scores under a single room lock
+        self.room_manager.apply_batch(room_id, [apply_round_scores])
         
         return GamePhase.RESULTS.value
     
@@ -552,7 +565,7 @@ class GameManager:
             return False, "Need at least 2 players to start"
         
         current_phase = room["game_state"]["phase"]
-        if current_phase not in ["waiting", "results"]:
+        if current_phase not in ROUND_START_PHASES:
             return False, f"Cannot start round during {current_phase} phase"
         
         return True, "Ready to start"
\ No newline at end of file
@@ -174,7 +174,7 @@ class BaseHandler(ABC):
         """Log the start of handler execution."""
         logger.info(f'{handler_name} called by client: {request.sid}')  # type: ignore[attr-defined]
         if data:
-            logger.debug(f'{handler_name} data: {data}')
+            logger.debug('%s data: %s', handler_name, data)
 
     def log_handler_success(self, handler_name: str, message: Optional[str] = None) -> None:
         """Log successful handler completion."""
@@ -195,12 +195,12 @@ class RoomHandlerMixin:
     def join_socketio_room(self, room_id: str) -> None:
         """Join a Socket.IO room for broadcasting."""
         join_room(room_id)
-        logger.debug(f'Client {request.sid} joined Socket.IO room: {room_id}')  # type: ignore[attr-defined]
+        logger.debug('Client %s joined Socket.IO room: %s', request.sid, room_id)  # type: ignore[attr-defined]
 
     def leave_socketio_room(self, room_id: str) -> None:
         """Leave a Socket.IO room."""
         leave_room(room_id)
-        logger.debug(f'Client {request.sid} left Socket.IO room: {room_id}')  # type: ignore[attr-defined]
+        logger.debug('Client %s left Socket.IO room: %s', request.sid, room_id)  # type: ignore[attr-defined]
 
     def broadcast_to_room(self, room_id: str, event_name: str, data: Dict[str, Any]) -> None:
         """
@@ -212,7 +212,7 @@ class RoomHandlerMixin:
             data: The data to broadcast
         """
         emit(event_name, data, to=room_id)
-        logger.debug(f'Broadcasted {event_name} to room: {room_id}')
+        logger.debug('Broadcasted %s to room: %s', event_name, room_id)
 
 
 class GameHandlerMixin:
@@ -67,7 +67,7 @@ class RoomConnectionHandler(BaseRoomHandler):
             })
 
             # Broadcast player list update to all players in room
-            self.broadcast_service.broadcast_player_list_update(room_id)
+            self.broadcast_service.broadcast_player_list_update(room_id, force=True)
 
             # Send current room state to joining player
             self.broadcast_service.send_room_state_to_player(room_id, request.sid)
@@ -110,7 +110,7 @@ class RoomConnectionHandler(BaseRoomHandler):
             })
 
             # Broadcast updated player list to remaining players
-            self.broadcast_service.broadcast_player_list_update(room_id)
+            self.broadcast_service.broadcast_player_list_update(room_id, force=True)
             self.broadcast_service.broadcast_room_state_update(room_id)
         else:
             raise ValidationError(
@@ -92,7 +92,7 @@ class SocketEventRouter:
         # Log incoming request
         logger.info(f"Handling event: {event_name} from client: {request.sid}")  # type: ignore[attr-defined]
         if data is not None:
-            logger.debug(f"Event data: {data}")
+            logger.debug("Event data: %s", data)
 
         try:
             # Execute before_request handlers
@@ -111,7 +111,7 @@ class SocketEventRouter:
             for handler in self._after_request_handlers:
                 handler(event_name, data, result)
 
-            logger.debug(f"Successfully handled event: {event_name}")
+            logger.debug("Successfully handled event: %s", event_name)
             return result
 
         except Exception as e:
@@ -105,7 +105,7 @@ def handle_disconnect(reason=None):
             auto_flow_service.handle_player_disconnect_game_impact(room_id, player_id)
 
             # Broadcast updated player list to remaining players
-            broadcast_service.broadcast_player_list_update(room_id)
+            broadcast_service.broadcast_player_list_update(room_id, force=True)
             broadcast_service.broadcast_room_state_update(room_id)
 
         # Clean up session
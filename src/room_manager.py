@@ -6,16 +6,24 @@ Acts as a facade over the decomposed services.
 """
 
 import logging
-from datetime import datetime
-from typing import Dict, Optional, List
+from typing import Callable, Dict, Optional, List, Mapping, Tuple
 
 from src.services.room_lifecycle_service import RoomLifecycleService
 from src.services.player_management_service import PlayerManagementService
 from src.services.room_state_service import RoomStateService
 from src.services.concurrency_control_service import ConcurrencyControlService
+from src.services.validation_service import ValidationService
 
 logger = logging.getLogger(__name__)
 
+def _is_valid_room_id(room_id) -> bool:
+    """Check whether room_id could name a room, using ValidationService's rules."""
+    return (
+        isinstance(room_id, str)
+        and len(room_id) <= ValidationService.MAX_ROOM_ID_LENGTH
+        and ValidationService.ROOM_ID_PATTERN.fullmatch(room_id) is not None
+    )
+
 
 class RoomManager:
     """Manages game rooms and their lifecycle with thread-safe operations."""
@@ -39,8 +47,10 @@ class RoomManager:
             Dict containing the room data
             
         Raises:
-            ValueError: If room already exists
+            ValueError: If room already exists or the room ID is invalid
         """
+        if not _is_valid_room_id(room_id):
+            raise ValueError(f"Invalid room ID: {room_id!r}")
         return self.lifecycle.create_room(room_id)
     
     def delete_room(self, room_id: str) -> bool:
@@ -53,6 +63,8 @@ class RoomManager:
         Returns:
             True if room was deleted, False if room didn't exist
         """
+        if not _is_valid_room_id(room_id):
+            return False
         result = self.lifecycle.delete_room(room_id)
         if result:
             self.concurrency_control.cleanup_room_lock(room_id)
@@ -68,6 +80,8 @@ class RoomManager:
         Returns:
             True if room exists, False otherwise
         """
+        if not _is_valid_room_id(room_id):
+            return False
         return self.lifecycle.room_exists(room_id)
     
     def get_all_rooms(self) -> List[str]:
@@ -79,6 +93,24 @@ class RoomManager:
         """
         return self.lifecycle.get_all_room_ids()
     
+    def get_expired_room_ids(self) -> List[str]:
+        """
+        Get rooms whose running phase timer has passed its deadline.
+        
+        Returns:
+            List of room ID strings, earliest deadline first
+        """
+        return self.lifecycle.get_expired_room_ids()
+    
+    def find_available_room(self) -> Optional[str]:
+        """
+        Find a room that is waiting for players and has a free slot.
+        
+        Returns:
+            Room ID or None if no room is available
+        """
+        return self.lifecycle.find_available_room()
+    
     def cleanup_inactive_rooms(self, max_inactive_minutes: int = 60) -> int:
         """
         Clean up rooms that have been inactive for too long.
@@ -102,8 +134,10 @@ class RoomManager:
         Returns:
             Room data dict or None if room doesn't exist
         """
+        if not _is_valid_room_id(room_id):
+            return None
         return self.state.get_room_state(room_id)
-    
+
     def update_game_state(self, room_id: str, game_state: Dict) -> bool:
         """
         Update the game state for a room with race condition protection.
@@ -115,6 +149,8 @@ class RoomManager:
         Returns:
             True if room was updated, False if room doesn't exist
         """
+        if not _is_valid_room_id(room_id):
+            return False
         return self.state.update_game_state(room_id, game_state)
     
     def update_room_activity(self, room_id: str) -> bool:
@@ -127,8 +163,28 @@ class RoomManager:
         Returns:
             True if room was updated, False if room doesn't exist
         """
+        if not _is_valid_room_id(room_id):
+            return False
         return self.state.update_room_activity(room_id)
     
+    def apply_batch(self, room_id: str, mutators: List[Callable[[Dict], None]]) -> Optional[Dict]:
+        """
+        Apply several room mutations under a single lock acquisition.
+        
+        Game phase changes must go through update_game_state, which validates
+        the transition; batches are not validated.
+        
+        Args:
+            room_id: ID of the room
+            mutators: Callables applied in order to the live room dict
+            
+        Returns:
+            Room snapshot after the batch, or None if room doesn't exist
+        """
+        if not _is_valid_room_id(room_id):
+            return None
+        return self.state.apply_batch(room_id, mutators)
+    
     # Player Management Operations
     def add_player_to_room(self, room_id: str, player_name: str, socket_id: str) -> Dict:
         """
@@ -143,8 +199,10 @@ class RoomManager:
             Player data dict
             
         Raises:
-            ValueError: If player name is already taken in the room
+            ValueError: If player name is already taken in the room or the room ID is invalid
         """
+        if not _is_valid_room_id(room_id):
+            raise ValueError(f"Invalid room ID: {room_id!r}")
         return self.players.add_player_to_room(room_id, player_name, socket_id)
     
     def disconnect_player_from_room(self, room_id: str, player_id: str) -> bool:
@@ -159,6 +217,8 @@ class RoomManager:
         Returns:
             True if player was marked as disconnected, False if player or room didn't exist
         """
+        if not _is_valid_room_id(room_id):
+            return False
         return self.players.disconnect_player_from_room(room_id, player_id)
     
     def remove_player_from_room(self, room_id: str, player_id: str) -> bool:
@@ -172,6 +232,8 @@ class RoomManager:
         Returns:
             True if player was removed, False if player or room didn't exist
         """
+        if not _is_valid_room_id(room_id):
+            return False
         return self.players.remove_player_from_room(room_id, player_id)
     
     def get_room_players(self, room_id: str) -> List[Dict]:
@@ -184,6 +246,8 @@ class RoomManager:
         Returns:
             List of player data dicts
         """
+        if not _is_valid_room_id(room_id):
+            return []
         return self.players.get_room_players(room_id)
     
     def get_connected_players(self, room_id: str) -> List[Dict]:
@@ -196,8 +260,38 @@ class RoomManager:
         Returns:
             List of connected player data dicts
         """
+        if not _is_valid_room_id(room_id):
+            return []
         return self.players.get_connected_players(room_id)
     
+    def get_phase_progress(self, room_id: str) -> Optional[Tuple[str, int, int, int]]:
+        """
+        Get the current phase together with the counts needed to decide whether it is complete.
+        
+        Args:
+            room_id: ID of the room
+            
+        Returns:
+            (phase, connected_count, response_count, guess_count) tuple, or None if room doesn't exist
+        """
+        if not _is_valid_room_id(room_id):
+            return None
+        return self.players.get_phase_progress(room_id)
+    
+    def get_connected_players_readonly(self, room_id: str) -> List[Mapping]:
+        """
+        Get read-only views of connected players in a room without copying.
+        
+        Args:
+            room_id: ID of the room
+            
+        Returns:
+            List of read-only connected player mappings
+        """
+        if not _is_valid_room_id(room_id):
+            return []
+        return self.players.get_connected_players_readonly(room_id)
+    
     def is_room_empty(self, room_id: str) -> bool:
         """
         Check if a room has no connected players.
@@ -208,6 +302,8 @@ class RoomManager:
         Returns:
             True if room has no connected players or doesn't exist, False otherwise
         """
+        if not _is_valid_room_id(room_id):
+            return True
         return self.players.is_room_empty(room_id)
     
     def update_player_score(self, room_id: str, player_id: str, score: int) -> bool:
@@ -222,6 +318,8 @@ class RoomManager:
         Returns:
             True if update was successful, False otherwise
         """
+        if not _is_valid_room_id(room_id):
+            return False
         return self.players.update_player_score(room_id, player_id, score)
     
     # Test compatibility properties and methods
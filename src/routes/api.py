@@ -18,6 +18,10 @@ def create_api_blueprint(services):
     # Store service references
     room_manager = services['room_manager']
     
+    # Max response length only depends on configuration, so resolve it once
+    from src.services.validation_service import ValidationService
+    max_response_length = ValidationService().get_max_response_length()
+    
     # Create the blueprint
     api = Blueprint('api', __name__)
     
@@ -30,19 +34,10 @@ def create_api_blueprint(services):
     def find_available_room():
         """Find a room that's waiting for players."""
         try:
-            room_ids = room_manager.get_all_rooms()
-            
-            for room_id in room_ids:
-                room_state = room_manager.get_room_state(room_id)
-                if (room_state and 
-                    room_state.get('game_state', {}).get('phase') == 'waiting' and 
-                    len(room_state.get('players', {})) >= 1 and  # Has at least 1 player
-                    len(room_state.get('players', {})) < 8):     # But not full
-                    logger.info(f'Found available room: {room_id} with {len(room_state.get("players", {}))} players')
-                    return {'room_id': room_id}
-            
-            # No available rooms found
-            return {'room_id': None}
+            room_id = room_manager.find_available_room()
+            if room_id:
+                logger.info(f'Found available room: {room_id}')
+            return {'room_id': room_id}
         except Exception as e:
             logger.error(f'Error finding available room: {e}')
             return {'room_id': None}
@@ -50,10 +45,6 @@ def create_api_blueprint(services):
     @api.route('/<room_id>')
     def room(room_id):
         """Serve the game interface for a specific room."""
-        # Get max response length from validation service
-        from src.services.validation_service import ValidationService
-        validation_service = ValidationService()
-        max_response_length = validation_service.get_max_response_length()
         return render_template('game.html', room_id=room_id, max_response_length=max_response_length)
     
     return api
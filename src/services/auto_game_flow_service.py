@@ -3,7 +3,6 @@ Auto Game Flow Service - Manages automatic phase transitions and timing.
 
 This service handles:
 - Phase timeouts and automatic advancement
-- Countdown broadcasting and time warnings  
 - Room cleanup for inactive sessions
 - Game state synchronization during phase changes
 """
@@ -11,7 +10,6 @@ This service handles:
 import logging
 import threading
 import time
-from typing import Dict
 from src.services.room_state_presenter import RoomStatePresenter
 from config_factory import get_config
 
@@ -32,15 +30,14 @@ class AutoGameFlowService:
         self.broadcast_service = broadcast_service
         self.game_manager = game_manager
         self.room_manager = room_manager
-        self.running = True
+        # Set by stop(); the timer loop waits on it so shutdown does not have to
+        # sit out the remainder of a check interval
+        self._stop_event = threading.Event()
         
         # Get configuration values
         config = get_config()
         self.check_interval = config.game_flow_check_interval
-        self.countdown_broadcast_interval = config.countdown_broadcast_interval
         self.room_status_broadcast_interval = config.room_status_broadcast_interval
-        self.warning_threshold_seconds = config.warning_threshold_seconds
-        self.final_warning_threshold_seconds = config.final_warning_threshold_seconds
         self.room_cleanup_inactive_minutes = config.room_cleanup_inactive_minutes
         self.min_players_required = config.min_players_required
         
@@ -53,92 +50,54 @@ class AutoGameFlowService:
         
         logger.info("AutoGameFlowService started")
     
+    @property
+    def running(self) -> bool:
+        """Whether the timer loop should keep running."""
+        return not self._stop_event.is_set()
+    
+    @running.setter
+    def running(self, value: bool):
+        if value:
+            self._stop_event.clear()
+        else:
+            self._stop_event.set()
+    
     def stop(self):
         """Stop the automatic game flow service."""
-        self.running = False
+        self._stop_event.set()
         if self.timer_thread.is_alive():
             self.timer_thread.join(timeout=2)
         logger.info("AutoGameFlowService stopped")
     
     def _timer_loop(self):
         """Main timer loop that checks for phase transitions."""
-        last_countdown_broadcast = {}  # room_id -> last_broadcast_time
+        next_cleanup_time = time.time() + self.room_status_broadcast_interval
         
         while self.running:
             try:
                 current_time = time.time()
                 
-                # Check for phase timeouts
+                # Check for phase timeouts. Clients count down locally from the
+                # phase_duration sent at phase start, so nothing is broadcast per tick.
                 self._check_phase_timeouts()
                 
-                # Broadcast countdown updates (every 10 seconds for active phases)
-                self._broadcast_countdown_updates(current_time, last_countdown_broadcast)
-                
-                # Clean up inactive rooms (less frequently)
-                if int(current_time) % self.room_status_broadcast_interval == 0:
+                # Clean up inactive rooms (less frequently). Compare against a
+                # deadline so sleep jitter can neither skip nor repeat a run.
+                if current_time >= next_cleanup_time:
                     self._cleanup_inactive_rooms()
+                    next_cleanup_time = current_time + self.room_status_broadcast_interval
                 
-                time.sleep(self.check_interval)
+                self._stop_event.wait(self.check_interval)
             except Exception as e:
                 logger.error(f"Error in timer loop: {e}")
-                time.sleep(self.check_interval)
-    
-    def _broadcast_countdown_updates(self, current_time: float, last_broadcast: Dict[str, float]):
-        """Broadcast countdown updates to active rooms."""
-        room_ids = self.room_manager.get_all_rooms()
-        
-        for room_id in room_ids:
-            try:
-                # Only broadcast every configured interval to avoid spam
-                if room_id in last_broadcast and current_time - last_broadcast[room_id] < self.countdown_broadcast_interval:
-                    continue
-                
-                room_state = self.room_manager.get_room_state(room_id)
-                if not room_state:
-                    continue
-                
-                game_state = room_state["game_state"]
-                current_phase = game_state["phase"]
-                
-                # Only broadcast for timed phases
-                if current_phase in ["responding", "guessing"]:
-                    time_remaining = self.game_manager.get_phase_time_remaining(room_id)
-                    
-                    # Broadcast countdown update
-                    countdown_data = {
-                        'phase': current_phase,
-                        'time_remaining': time_remaining,
-                        'phase_duration': game_state.get('phase_duration', 0)
-                    }
-                    
-                    self.broadcast_service.emit_to_room('countdown_update', countdown_data, room_id)
-                    last_broadcast[room_id] = current_time
-                    
-                    # Special warnings for low time
-                    if time_remaining <= self.warning_threshold_seconds and time_remaining > (self.warning_threshold_seconds - 5):
-                        self.broadcast_service.emit_to_room('time_warning', {
-                            'message': f'{self.warning_threshold_seconds} seconds remaining!',
-                            'time_remaining': time_remaining
-                        }, room_id)
-                    elif time_remaining <= self.final_warning_threshold_seconds and time_remaining > (self.final_warning_threshold_seconds - 5):
-                        self.broadcast_service.emit_to_room('time_warning', {
-                            'message': f'{self.final_warning_threshold_seconds} seconds remaining!',
-                            'time_remaining': time_remaining
-                        }, room_id)
-                
-            except Exception as e:
-                logger.error(f"Error broadcasting countdown for room {room_id}: {e}")
+                self._stop_event.wait(self.check_interval)
     
     def _check_phase_timeouts(self):
-        """Check all active rooms for phase timeouts and advance if needed."""
-        room_ids = self.room_manager.get_all_rooms()
-        
-        for room_id in room_ids:
+        """Advance rooms whose phase deadline has passed."""
+        for room_id in self.room_manager.get_expired_room_ids():
             try:
-                is_expired = self.game_manager.is_phase_expired(room_id)
-                if is_expired:
-                    logger.info(f"Phase expired for room {room_id}, handling timeout")
-                    self._handle_phase_timeout(room_id)
+                logger.info(f"Phase expired for room {room_id}, handling timeout")
+                self._handle_phase_timeout(room_id)
             except Exception as e:
                 logger.error(f"Error checking phase timeout for room {room_id}: {e}")
     
@@ -196,7 +155,7 @@ class AutoGameFlowService:
             guessing_info['timeout_reason'] = 'Response time expired'
             
             self.broadcast_service.emit_to_room('guessing_phase_started', guessing_info, room_id)
-            logger.debug(f'Broadcasted guessing phase start (timeout) to room {room_id}')
+            logger.debug('Broadcasted guessing phase start (timeout) to room %s', room_id)
             
         except Exception as e:
             logger.error(f'Error broadcasting guessing phase start: {e}')
@@ -220,7 +179,7 @@ class AutoGameFlowService:
                 # Broadcast updated player list with new scores
                 self.broadcast_service.broadcast_player_list_update(room_id)
                 
-                logger.debug(f'Broadcasted results phase start (timeout) to room {room_id}')
+                logger.debug('Broadcasted results phase start (timeout) to room %s', room_id)
             
         except Exception as e:
             logger.error(f'Error broadcasting results phase start: {e}')
@@ -232,7 +191,7 @@ class AutoGameFlowService:
                 'phase': 'waiting',
                 'message': 'Round completed. Ready for next round.'
             }, room_id)
-            logger.debug(f'Broadcasted round end to room {room_id}')
+            logger.debug('Broadcasted round end to room %s', room_id)
             
         except Exception as e:
             logger.error(f'Error broadcasting round end: {e}')
@@ -240,25 +199,18 @@ class AutoGameFlowService:
     def handle_player_disconnect_game_impact(self, room_id: str, disconnected_player_id: str):
         """Handle the impact of player disconnection on game flow."""
         try:
-            room_state = self.room_manager.get_room_state(room_id)
-            if not room_state:
+            progress = self.room_manager.get_phase_progress(room_id)
+            if not progress:
                 logger.warning(f"Room {room_id} not found during disconnect handling")
                 return
             
-            game_state = room_state.get("game_state", {})
-            current_phase = game_state.get("phase", "waiting")
-            
-            try:
-                connected_players = self.room_manager.get_connected_players(room_id)
-            except Exception as e:
-                logger.error(f"Error getting connected players for room {room_id}: {e}")
-                connected_players = []
+            current_phase, connected_count, response_count, guess_count = progress
             
             logger.info(f"Handling disconnect impact for player {disconnected_player_id} in room {room_id}, "
-                       f"phase: {current_phase}, remaining players: {len(connected_players)}")
+                       f"phase: {current_phase}, remaining players: {connected_count}")
             
             # If insufficient players left, reset to waiting phase
-            if len(connected_players) < self.min_players_required:
+            if connected_count < self.min_players_required:
                 if current_phase != "waiting":
                     logger.info(f"Insufficient players in room {room_id}, resetting to waiting phase")
                     # Directly reset to waiting phase
@@ -278,8 +230,7 @@ class AutoGameFlowService:
             
             # Check if we can auto-advance due to all remaining players having completed current phase
             if current_phase == "responding":
-                responses = game_state.get("responses", [])
-                if len(responses) >= len(connected_players):
+                if response_count >= connected_count:
                     logger.info(f"All remaining players have responded in room {room_id}, advancing to guessing")
                     new_phase = self.game_manager.advance_game_phase(room_id)
                     if new_phase == "guessing":
@@ -287,8 +238,7 @@ class AutoGameFlowService:
                         self.broadcast_service.broadcast_room_state_update(room_id)
             
             elif current_phase == "guessing":
-                guesses = game_state.get("guesses", [])
-                if len(guesses) >= len(connected_players):
+                if guess_count >= connected_count:
                     logger.info(f"All remaining players have guessed in room {room_id}, advancing to results")
                     new_phase = self.game_manager.advance_game_phase(room_id)
                     if new_phase == "results":
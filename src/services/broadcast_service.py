@@ -10,11 +10,17 @@ This service handles all Socket.IO emissions in a centralized way:
 """
 
 import logging
-from typing import Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional, Tuple
 from config_factory import get_config
 
 logger = logging.getLogger(__name__)
 
+# Maximum number of presenter payloads kept; least recently used entries, such as
+# those of deleted rooms, are evicted first.
+_PAYLOAD_CACHE_SIZE = 1024
+
 
 class BroadcastService:
     """Centralized service for all Socket.IO broadcasting operations."""
@@ -34,6 +40,82 @@ class BroadcastService:
         self.game_manager = game_manager
         self.error_response_factory = error_response_factory
         self.room_state_presenter = room_state_presenter
+        
+        # Get configuration values
+        config = get_config()
+        self.results_display_time = config.results_display_time
+        # Presenter payloads keyed by (payload kind, room_id), reused for as long as
+        # the room's state version is unchanged
+        self._payload_cache: "OrderedDict[Tuple[str, str], Tuple[int, Dict[str, Any]]]" = OrderedDict()
+        self._payload_cache_lock = threading.Lock()
+        # Last payload emitted per (event, room_id), for events whose repeats are skipped,
+        # tagged with the room's creation time so a room recreated under the same ID
+        # never matches the deleted room's last payload
+        self._last_emitted: "OrderedDict[Tuple[str, str], Tuple[Any, Dict[str, Any]]]" = OrderedDict()
+    
+    def _get_cached_payload(self, kind: str, room_id: str, version: Optional[int],
+                            build: Callable[[], Dict[str, Any]],
+                            refresh: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None) -> Dict[str, Any]:
+        """Return the payload built for this room version, building it on a miss.
+        
+        Args:
+            kind: Payload type, so different payloads for a room are cached separately
+            room_id: Room identifier
+            version: Room state version the payload reflects, or None to skip caching
+            build: Creates the payload from the current room state
+            refresh: Updates the time-dependent fields of a reused payload
+            
+        Returns:
+            Payload dict, which must not be mutated by the caller
+        """
+        if version is None:
+            return build()
+        
+        key = (kind, room_id)
+        with self._payload_cache_lock:
+            entry = self._payload_cache.get(key)
+            if entry is not None and entry[0] == version:
+                self._payload_cache.move_to_end(key)
+                payload = entry[1]
+                return refresh(payload) if refresh else payload
+        
+        payload = build()
+        with self._payload_cache_lock:
+            self._payload_cache[key] = (version, payload)
+            self._payload_cache.move_to_end(key)
+            if len(self._payload_cache) > _PAYLOAD_CACHE_SIZE:
+                self._payload_cache.popitem(last=False)
+        return payload
+    
+    def _is_repeat_emit(self, event: str, room_id: str, created_at: Any, data: Dict[str, Any]) -> bool:
+        """Record data as the latest payload of event for the room.
+        
+        Args:
+            event: Event name
+            room_id: Room identifier
+            created_at: Creation time of the room, identifying this incarnation of room_id
+            data: Payload about to be emitted
+            
+        Returns:
+            True if this room was last sent an identical payload for this event
+        """
+        key = (event, room_id)
+        entry = (created_at, data)
+        with self._payload_cache_lock:
+            if self._last_emitted.get(key) == entry:
+                self._last_emitted.move_to_end(key)
+                return True
+            self._last_emitted[key] = entry
+            self._last_emitted.move_to_end(key)
+            if len(self._last_emitted) > _PAYLOAD_CACHE_SIZE:
+                self._last_emitted.popitem(last=False)
+        return False
+    
+    def _refresh_time_remaining(self, safe_game_state: Dict[str, Any], room_id: str) -> Dict[str, Any]:
+        """Copy a reused game state payload with the current time remaining."""
+        if 'time_remaining' not in safe_game_state:
+            return safe_game_state
+        return {**safe_game_state, 'time_remaining': self.game_manager.get_phase_time_remaining(room_id)}
     
     # Core emission methods
     
@@ -41,45 +123,60 @@ class BroadcastService:
         """Emit an event to all players in a room."""
         try:
             self.socketio.emit(event, data, room=room_id)
-            logger.debug(f'Emitted {event} to room {room_id}')
+            logger.debug('Emitted %s to room %s', event, room_id)
         except Exception as e:
-            logger.error(f'Error emitting {event} to room {room_id}: {e}')
+            logger.error('Error emitting %s to room %s: %s', event, room_id, e)
     
     def emit_to_player(self, event: str, data: Dict[str, Any], socket_id: str):
         """Emit an event to a specific player."""
         try:
             self.socketio.emit(event, data, room=socket_id)
-            logger.debug(f'Emitted {event} to player {socket_id}')
+            logger.debug('Emitted %s to player %s', event, socket_id)
         except Exception as e:
-            logger.error(f'Error emitting {event} to player {socket_id}: {e}')
+            logger.error('Error emitting %s to player %s: %s', event, socket_id, e)
     
     def emit_error_to_player(self, error_response: Dict[str, Any], socket_id: str):
         """Emit an error message to a specific player."""
         try:
             self.socketio.emit('error', error_response, room=socket_id)
-            logger.debug(f'Emitted error to player {socket_id}: {error_response.get("error_code", "unknown")}')
+            logger.debug('Emitted error to player %s: %s', socket_id, error_response.get("error_code", "unknown"))
         except Exception as e:
-            logger.error(f'Error emitting error to player {socket_id}: {e}')
+            logger.error('Error emitting error to player %s: %s', socket_id, e)
     
     # High-level broadcast methods
     
-    def broadcast_player_list_update(self, room_id: str):
-        """Broadcast updated player list to all players in room."""
+    def broadcast_player_list_update(self, room_id: str, force: bool = False):
+        """Broadcast updated player list to all players in room.
+        
+        Args:
+            room_id: Room identifier
+            force: Emit even if the list matches the last one sent to the room;
+                used by join and leave flows, which must always announce the change
+        """
         try:
             room_state = self.room_manager.get_room_state(room_id)
             if not room_state:
                 return
             
-            connected_players = self.room_manager.get_connected_players(room_id)
-            
             # Use presenter to create consistent player list payload
-            player_info = self.room_state_presenter.create_player_list_update(room_state, connected_players)
+            player_info = self._get_cached_payload(
+                'player_list', room_id, room_state.get('version'),
+                lambda: self.room_state_presenter.create_player_list_update(
+                    room_state, self.room_manager.get_connected_players_readonly(room_id)))
+            
+            # Unless forced, skip a list everyone in the room already has, either from
+            # the last update or from the room state sent when they joined
+            is_repeat = self._is_repeat_emit('player_list_updated', room_id,
+                                             room_state.get('created_at'), player_info)
+            if is_repeat and not force:
+                logger.debug('Skipped unchanged player list update for room %s', room_id)
+                return
             
             self.emit_to_room('player_list_updated', player_info, room_id)
-            logger.debug(f'Broadcasted player list update to room {room_id}')
+            logger.debug('Broadcasted player list update to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting player list update: {e}')
+            logger.error('Error broadcasting player list update: %s', e)
     
     def broadcast_room_state_update(self, room_id: str):
         """Broadcast optimized room state update to all players in room."""
@@ -89,14 +186,17 @@ class BroadcastService:
                 return
             
             # Use presenter to create consistent safe game state
-            safe_game_state = self.room_state_presenter.create_safe_game_state(room_state, room_id)
+            safe_game_state = self._get_cached_payload(
+                'game_state', room_id, room_state.get('version'),
+                lambda: self.room_state_presenter.create_safe_game_state(room_state, room_id),
+                lambda cached: self._refresh_time_remaining(cached, room_id))
             
             # Broadcast the game state directly
             self.emit_to_room('room_state_updated', safe_game_state, room_id)
-            logger.debug(f'Broadcasted room state update to room {room_id}')
+            logger.debug('Broadcasted room state update to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting room state update: {e}')
+            logger.error('Error broadcasting room state update: %s', e)
     
     def send_room_state_to_player(self, room_id: str, socket_id: str):
         """Send complete room state to a specific player (for initial join/reconnect)."""
@@ -111,16 +211,18 @@ class BroadcastService:
                 self.emit_error_to_player(error_response, socket_id)
                 return
             
-            connected_players = self.room_manager.get_connected_players(room_id)
-            
             # Use presenter to create consistent room state payload
-            room_state_data = self.room_state_presenter.create_room_state_for_player(room_state, room_id, connected_players)
+            room_state_data = self._get_cached_payload(
+                'room_state', room_id, room_state.get('version'),
+                lambda: self.room_state_presenter.create_room_state_for_player(
+                    room_state, room_id, self.room_manager.get_connected_players_readonly(room_id)),
+                lambda cached: {**cached, 'game_state': self._refresh_time_remaining(cached['game_state'], room_id)})
             
             self.emit_to_player('room_state', room_state_data, socket_id)
-            logger.debug(f'Sent room state to player {socket_id} in room {room_id}')
+            logger.debug('Sent room state to player %s in room %s', socket_id, room_id)
             
         except Exception as e:
-            logger.error(f'Error sending room state to player: {e}')
+            logger.error('Error sending room state to player: %s', e)
     
     def broadcast_round_started(self, room_id: str):
         """Broadcast round start notification to all players in room."""
@@ -140,54 +242,54 @@ class BroadcastService:
                 }
                 
                 self.emit_to_room('round_started', prompt_info, room_id)
-                logger.debug(f'Broadcasted round start to room {room_id}')
+                logger.debug('Broadcasted round start to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting round start: {e}')
+            logger.error('Error broadcasting round start: %s', e)
     
     def broadcast_response_submitted(self, room_id: str):
         """Broadcast response submission notification to all players in room."""
         try:
-            room_state = self.room_manager.get_room_state(room_id)
-            if not room_state:
+            # Only counts are needed, so skip copying the room state and listing players
+            progress = self.room_manager.get_phase_progress(room_id)
+            if not progress:
                 return
             
-            game_state = room_state['game_state']
-            connected_players = self.room_manager.get_connected_players(room_id)
+            _, connected_count, response_count, _ = progress
             
             response_info = {
-                'response_count': len(game_state['responses']),
-                'total_players': len(connected_players),
+                'response_count': response_count,
+                'total_players': connected_count,
                 'time_remaining': self.game_manager.get_phase_time_remaining(room_id)
             }
             
             self.emit_to_room('response_submitted', response_info, room_id)
-            logger.debug(f'Broadcasted response submission to room {room_id}')
+            logger.debug('Broadcasted response submission to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting response submission: {e}')
+            logger.error('Error broadcasting response submission: %s', e)
     
     def broadcast_guess_submitted(self, room_id: str):
         """Broadcast guess submission notification to all players in room."""
         try:
-            room_state = self.room_manager.get_room_state(room_id)
-            if not room_state:
+            # Only counts are needed, so skip copying the room state and listing players
+            progress = self.room_manager.get_phase_progress(room_id)
+            if not progress:
                 return
             
-            game_state = room_state['game_state']
-            connected_players = self.room_manager.get_connected_players(room_id)
+            _, connected_count, _, guess_count = progress
             
             guess_info = {
-                'guess_count': len(game_state['guesses']),
-                'total_players': len(connected_players),
+                'guess_count': guess_count,
+                'total_players': connected_count,
                 'time_remaining': self.game_manager.get_phase_time_remaining(room_id)
             }
             
             self.emit_to_room('guess_submitted', guess_info, room_id)
-            logger.debug(f'Broadcasted guess submission to room {room_id}')
+            logger.debug('Broadcasted guess submission to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting guess submission: {e}')
+            logger.error('Error broadcasting guess submission: %s', e)
     
     def broadcast_guessing_phase_started(self, room_id: str):
         """Broadcast guessing phase start notification to all players in room."""
@@ -196,21 +298,27 @@ class BroadcastService:
             if not room_state:
                 return
             
+            # Build the shared payload once; each player only differs by their own response
+            shared_info = self.room_state_presenter.create_guessing_phase_data(room_state, room_id)
+            responses = room_state['game_state']['responses']
+            
             # Send personalized responses to each player (excluding their own response)
-            for player_id in room_state['players']:
-                player = room_state['players'][player_id]
+            for player_id, player in room_state['players'].items():
                 if not player.get('connected', False):
                     continue
                 
-                # Use presenter to create personalized guessing phase data
-                guessing_info = self.room_state_presenter.create_guessing_phase_data(room_state, room_id, player_id)
+                guessing_info = dict(shared_info)
+                guessing_info['responses'] = [
+                    response for response in shared_info['responses']
+                    if responses[response['index']].get('author_id') != player_id
+                ]
                 
                 self.emit_to_player('guessing_phase_started', guessing_info, player['socket_id'])
             
-            logger.debug(f'Broadcasted guessing phase start to room {room_id}')
+            logger.debug('Broadcasted guessing phase start to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting guessing phase start: {e}')
+            logger.error('Error broadcasting guessing phase start: %s', e)
     
     def broadcast_results_phase_started(self, room_id: str):
         """Broadcast results phase start notification to all players in room."""
@@ -226,13 +334,12 @@ class BroadcastService:
             # Get scoring summary
             scoring_summary = self.game_manager.get_scoring_summary(room_id)
             
-            config = get_config()
             results_info = {
                 'phase': 'results',
                 'round_results': round_results,
                 'leaderboard': leaderboard,
                 'scoring_summary': scoring_summary,
-                'phase_duration': config.results_display_time
+                'phase_duration': self.results_display_time
             }
             
             self.emit_to_room('results_phase_started', results_info, room_id)
@@ -240,10 +347,10 @@ class BroadcastService:
             # Broadcast updated player list with new scores
             self.broadcast_player_list_update(room_id)
             
-            logger.debug(f'Broadcasted results phase start to room {room_id}')
+            logger.debug('Broadcasted results phase start to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting results phase start: {e}')
+            logger.error('Error broadcasting results phase start: %s', e)
     
     def broadcast_phase_auto_advanced(self, room_id: str, message: str, new_phase: str, reason: str):
         """Broadcast phase auto-advancement notification."""
@@ -255,10 +362,10 @@ class BroadcastService:
             }
             
             self.emit_to_room('phase_auto_advanced', advance_info, room_id)
-            logger.debug(f'Broadcasted phase auto-advance to room {room_id}: {new_phase}')
+            logger.debug('Broadcasted phase auto-advance to room %s: %s', room_id, new_phase)
             
         except Exception as e:
-            logger.error(f'Error broadcasting phase auto-advance: {e}')
+            logger.error('Error broadcasting phase auto-advance: %s', e)
     
     def broadcast_player_disconnected(self, room_id: str, remaining_count: int, phase: str):
         """Broadcast player disconnection notification."""
@@ -270,46 +377,19 @@ class BroadcastService:
             }
             
             self.emit_to_room('player_disconnected', disconnect_info, room_id)
-            logger.debug(f'Broadcasted player disconnect to room {room_id}')
+            logger.debug('Broadcasted player disconnect to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting player disconnect: {e}')
+            logger.error('Error broadcasting player disconnect: %s', e)
     
     def broadcast_game_paused(self, room_id: str, error_response: Dict[str, Any]):
         """Broadcast game pause notification."""
         try:
             self.emit_to_room('game_paused', error_response, room_id)
-            logger.debug(f'Broadcasted game pause to room {room_id}')
-            
-        except Exception as e:
-            logger.error(f'Error broadcasting game pause: {e}')
-    
-    def broadcast_countdown_update(self, room_id: str, phase: str, time_remaining: int, duration: int):
-        """Broadcast countdown update for active phases."""
-        try:
-            countdown_data = {
-                'phase': phase,
-                'time_remaining': time_remaining,
-                'phase_duration': duration
-            }
-            
-            self.emit_to_room('countdown_update', countdown_data, room_id)
-            
-        except Exception as e:
-            logger.error(f'Error broadcasting countdown update: {e}')
-    
-    def broadcast_time_warning(self, room_id: str, message: str, time_remaining: int):
-        """Broadcast time warning for active phases."""
-        try:
-            warning_data = {
-                'message': message,
-                'time_remaining': time_remaining
-            }
-            
-            self.emit_to_room('time_warning', warning_data, room_id)
+            logger.debug('Broadcasted game pause to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting time warning: {e}')
+            logger.error('Error broadcasting game pause: %s', e)
     
     def broadcast_round_ended(self, room_id: str):
         """Broadcast round end notification."""
@@ -318,10 +398,10 @@ class BroadcastService:
                 'phase': 'waiting',
                 'message': 'Round completed. Ready for next round.'
             }, room_id)
-            logger.debug(f'Broadcasted round end to room {room_id}')
+            logger.debug('Broadcasted round end to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting round end: {e}')
+            logger.error('Error broadcasting round end: %s', e)
     
     def broadcast_game_reset(self, room_id: str, message: str):
         """Broadcast game reset notification."""
@@ -332,7 +412,7 @@ class BroadcastService:
             }
             
             self.emit_to_room('game_reset', reset_data, room_id)
-            logger.debug(f'Broadcasted game reset to room {room_id}')
+            logger.debug('Broadcasted game reset to room %s', room_id)
             
         except Exception as e:
-            logger.error(f'Error broadcasting game reset: {e}')
\ No newline at end of file
+            logger.error('Error broadcasting game reset: %s', e)
\ No newline at end of file
@@ -8,8 +8,9 @@ Extracted from RoomManager to follow Single Responsibility Principle.
 import logging
 import threading
 import time
+from collections import defaultdict, deque
 from contextlib import contextmanager
-from typing import Dict
+from typing import Deque, Dict, Tuple
 from src.config.game_settings import get_game_settings
 
 logger = logging.getLogger(__name__)
@@ -19,27 +20,26 @@ class ConcurrencyControlService:
     """Manages concurrency control, locking, and request deduplication."""
     
     def __init__(self):
-        # Per-room locks for fine-grained control
-        self._room_locks: Dict[str, threading.RLock] = {}
-        # Lock for managing room locks themselves
-        self._locks_lock = threading.Lock()
-        # Request deduplication
+        # Per-room locks for fine-grained control. These are plain (non-reentrant)
+        # locks: no room operation nests another on the same room. Missing locks
+        # are created by defaultdict's __missing__ and removed with dict.pop, both
+        # atomic under the GIL, so the mapping needs no lock of its own.
+        self._room_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+        # Request deduplication: keys seen within the window, plus the same keys in
+        # arrival order so expired ones can be dropped from the front
         self._recent_requests: Dict[str, float] = {}
+        self._request_queue: Deque[Tuple[float, str]] = deque()
+        self._requests_lock = threading.Lock()
         self.game_settings = get_game_settings()
         self._request_window = self.game_settings.request_dedup_window
     
-    def get_room_lock(self, room_id: str) -> threading.RLock:
+    def get_room_lock(self, room_id: str) -> threading.Lock:
         """Get or create a lock for a specific room."""
-        with self._locks_lock:
-            if room_id not in self._room_locks:
-                self._room_locks[room_id] = threading.RLock()
-            return self._room_locks[room_id]
+        return self._room_locks[room_id]
     
     def cleanup_room_lock(self, room_id: str):
         """Clean up lock for a deleted room."""
-        with self._locks_lock:
-            if room_id in self._room_locks:
-                del self._room_locks[room_id]
+        self._room_locks.pop(room_id, None)
     
     @contextmanager
     def room_operation(self, room_id: str):
@@ -52,16 +52,18 @@ class ConcurrencyControlService:
         """Check if this is a duplicate request within the time window."""
         current_time = time.time()
         
-        # Clean up old requests
-        expired_keys = [key for key, timestamp in self._recent_requests.items() 
-                       if current_time - timestamp > self._request_window]
-        for key in expired_keys:
-            del self._recent_requests[key]
-        
-        # Check if request is duplicate
-        if request_key in self._recent_requests:
-            return True
-        
-        # Record this request
-        self._recent_requests[request_key] = current_time
-        return False
\ No newline at end of file
+        with self._requests_lock:
+            # Clean up old requests; only the expired ones at the front are visited
+            queue = self._request_queue
+            while queue and current_time - queue[0][0] > self._request_window:
+                _, key = queue.popleft()
+                self._recent_requests.pop(key, None)
+            
+            # Check if request is duplicate
+            if request_key in self._recent_requests:
+                return True
+            
+            # Record this request
+            self._recent_requests[request_key] = current_time
+            queue.append((current_time, request_key))
+            return False
\ No newline at end of file
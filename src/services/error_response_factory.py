@@ -7,6 +7,7 @@ Provides standardized error and success response creation functionality.
 import logging
 import hashlib
 import json
+import traceback
 from typing import Dict, Optional
 
 from src.core.errors import ErrorCode, ValidationError
@@ -122,7 +123,6 @@ class ErrorResponseFactory:
             return e.code, e.message
         
         # Log the full exception for debugging
-        import traceback
         logger.error(f"Unexpected exception in {context}: {str(e)}")
         logger.error(f"Exception traceback: {traceback.format_exc()}")
         
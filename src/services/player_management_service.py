@@ -7,10 +7,12 @@ Extracted from RoomManager to follow Single Responsibility Principle.
 
 import logging
 from datetime import datetime
-from typing import Dict, List, Optional
-import uuid
+from types import MappingProxyType
+from typing import Dict, List, Mapping, Optional, Tuple
+import secrets
 import threading
 from src.config.game_settings import get_game_settings
+from src.services.room_lifecycle_service import bump_room_version
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ class PlayerManagementService:
     def _create_player_data(self, player_name: str, socket_id: str) -> Dict:
         """Create player data structure."""
         return {
-            "player_id": str(uuid.uuid4()),
+            "player_id": secrets.token_urlsafe(12),
             "name": player_name,
             "score": 0,
             "socket_id": socket_id,
@@ -52,16 +54,36 @@ class PlayerManagementService:
                 return player
         return None
     
+    def _adjust_connected_count(self, room: Dict, delta: int) -> None:
+        """Adjust the room's connected player counter, if the room tracks one."""
+        if "connected_count" in room:
+            room["connected_count"] += delta
+    
+    def _count_connected_players(self, room: Dict) -> int:
+        """Get the number of connected players, scanning only for rooms without a counter."""
+        connected_count = room.get("connected_count")
+        if connected_count is None:
+            connected_count = sum(1 for player in room["players"].values() if player.get("connected", True))
+        return connected_count
+    
     def _add_player_to_room_state(self, room: Dict, player_data: Dict) -> None:
         """Add player to room state."""
         room["players"][player_data["player_id"]] = player_data
+        if player_data.get("connected", True):
+            self._adjust_connected_count(room, 1)
+        bump_room_version(room)
         room["last_activity"] = datetime.now()
+        self.room_lifecycle_service.update_room_indexes(room)
     
     def _remove_player_from_room_state(self, room: Dict, player_id: str) -> None:
         """Remove player from room state."""
         if player_id in room["players"]:
-            del room["players"][player_id]
+            player = room["players"].pop(player_id)
+            if player.get("connected", True):
+                self._adjust_connected_count(room, -1)
+            bump_room_version(room)
             room["last_activity"] = datetime.now()
+            self.room_lifecycle_service.update_room_indexes(room)
     
     def add_player_to_room(self, room_id: str, player_name: str, socket_id: str) -> Dict:
         """
@@ -101,6 +123,8 @@ class PlayerManagementService:
                 # Restore existing player with new socket_id
                 existing_player["socket_id"] = socket_id
                 existing_player["connected"] = True
+                self._adjust_connected_count(room, 1)
+                bump_room_version(room)
                 room["last_activity"] = datetime.now()
                 player_data = existing_player
                 logger.info(f"Player {player_name} reconnected to room {room_id} with preserved score {existing_player['score']}")
@@ -130,7 +154,10 @@ class PlayerManagementService:
                 return False
             
             player = room["players"][player_id]
+            if player.get("connected", True):
+                self._adjust_connected_count(room, -1)
             player["connected"] = False
+            bump_room_version(room)
             room["last_activity"] = datetime.now()
             
             logger.info(f"Player {player['name']} ({player_id}) marked as disconnected in room {room_id}")
@@ -155,7 +182,7 @@ class PlayerManagementService:
             self._remove_player_from_room_state(room, player_id)
             
             # Check if room should be cleaned up
-            if self.is_room_empty(room_id):
+            if self._is_room_empty_for(room):
                 self.room_lifecycle_service.delete_room(room_id)
             
             return True
@@ -187,11 +214,48 @@ class PlayerManagementService:
             List of connected player data dicts
         """
         room = self.room_lifecycle_service.get_room_data(room_id)
-        if not room:
+        if not room or room.get("connected_count") == 0:
             return []
         
         return [player.copy() for player in room["players"].values() if player["connected"]]
     
+    def get_phase_progress(self, room_id: str) -> Optional[Tuple[str, int, int, int]]:
+        """
+        Get the current phase together with the counts needed to decide whether it is complete.
+        
+        Args:
+            room_id: ID of the room
+            
+        Returns:
+            (phase, connected_count, response_count, guess_count) tuple, or None if room doesn't exist
+        """
+        room = self.room_lifecycle_service.get_room_data(room_id)
+        if not room:
+            return None
+        
+        game_state = room["game_state"]
+        return (game_state.get("phase", "waiting"), self._count_connected_players(room),
+                len(game_state.get("responses", ())), len(game_state.get("guesses", ())))
+    
+    def get_connected_players_readonly(self, room_id: str) -> List[Mapping]:
+        """
+        Get read-only views of connected players in a room without copying them.
+        
+        The views reflect later changes to the players, so callers that need a
+        stable snapshot or want to mutate the data should use get_connected_players.
+        
+        Args:
+            room_id: ID of the room
+            
+        Returns:
+            List of read-only connected player mappings
+        """
+        room = self.room_lifecycle_service.get_room_data(room_id)
+        if not room or room.get("connected_count") == 0:
+            return []
+        
+        return [MappingProxyType(player) for player in room["players"].values() if player["connected"]]
+    
     def is_room_empty(self, room_id: str) -> bool:
         """
         Check if a room has no connected players.
@@ -205,9 +269,12 @@ class PlayerManagementService:
         room = self.room_lifecycle_service.get_room_data(room_id)
         if not room:
             return True
+        return self._is_room_empty_for(room)
+    
+    def _is_room_empty_for(self, room: Dict) -> bool:
+        """Check if an already looked-up room has no connected players."""
         # Count only connected players for determining if room is "empty"
-        connected_count = sum(1 for player in room["players"].values() if player.get("connected", True))
-        return connected_count == 0
+        return self._count_connected_players(room) == 0
     
     def update_player_score(self, room_id: str, player_id: str, score: int) -> bool:
         """
@@ -227,5 +294,6 @@ class PlayerManagementService:
                 return False
             
             room["players"][player_id]["score"] = score
+            bump_room_version(room)
             room["last_activity"] = datetime.now()
             return True
\ No newline at end of file
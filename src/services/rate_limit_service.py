@@ -2,7 +2,6 @@
 Rate limiting service for preventing event queue overflow and implementing rate limiting.
 """
 
-import os
 import time
 import threading
 import logging
@@ -12,6 +11,7 @@ from typing import Optional
 from flask import request
 from flask_socketio import emit
 
+from src.config.environment import is_testing
 from src.core.errors import ErrorCode
 from config_factory import get_config
 
@@ -39,15 +39,8 @@ class EventQueueManager:
         self.block_duration = 60  # Block duration in seconds (not yet configurable)
     
     def _is_testing(self):
-        """Check if we're in a testing environment at runtime"""
-        import sys
-        return (
-            os.environ.get('TESTING') == '1' or 
-            'pytest' in os.environ.get('_', '') or
-            'pytest' in sys.modules or
-            any('pytest' in arg for arg in sys.argv) or
-            'test' in sys.argv[0].lower() if sys.argv else False
-        )
+        """Check if we're in a testing environment"""
+        return is_testing()
         
     def is_client_blocked(self, client_id: str) -> bool:
         """Check if a client is currently blocked."""
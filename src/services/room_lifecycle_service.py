@@ -5,21 +5,52 @@ Handles room creation, deletion, and existence checking.
 Extracted from RoomManager to follow Single Responsibility Principle.
 """
 
+import heapq
+import itertools
 import logging
-from datetime import datetime
-from typing import Dict, List, Optional
+from datetime import datetime, timedelta
+from typing import Dict, List, Optional, Tuple
 import threading
 from src.config.game_settings import get_game_settings
 
 logger = logging.getLogger(__name__)
 
 
+# Process-wide source of room state versions. Versions never repeat, even when a
+# room ID is reused after its room was deleted, so a (room_id, version) pair
+# always names a single room state.
+_next_room_version = itertools.count().__next__
+
+
+def bump_room_version(room: Dict) -> None:
+    """Advance the room's state version."""
+    room["version"] = _next_room_version()
+
+
 class RoomLifecycleService:
     """Manages room creation, deletion, and lifecycle operations."""
     
     def __init__(self):
         self._rooms: Dict[str, Dict] = {}
-        self._rooms_lock = threading.RLock()
+        self._rooms_lock = threading.Lock()
+        # Min-heap of (last_activity, room_id) used to find inactive rooms without
+        # scanning every room. Entries are invalidated lazily: only the entry whose
+        # timestamp matches _scheduled_activity[room_id] is considered current.
+        # Activity updates do not touch the heap; the cleanup sweep reschedules a
+        # room when it finds last_activity has moved past its entry. A room's
+        # last_activity must therefore only ever increase: moving it back in time
+        # leaves the room behind a later entry, so it is not cleaned up until
+        # that entry comes due.
+        self._activity_heap: List[Tuple[datetime, str]] = []
+        self._scheduled_activity: Dict[str, datetime] = {}
+        # Rooms in the waiting phase with at least one player and a free slot,
+        # kept as an insertion-ordered dict so matchmaking prefers older rooms.
+        self._available_rooms: Dict[str, None] = {}
+        # Phase deadlines of rooms whose current phase has a running timer, with a
+        # min-heap of (deadline, room_id) so the game flow timer only visits rooms
+        # that have expired. Invalidated lazily like the activity heap.
+        self._timed_rooms: Dict[str, datetime] = {}
+        self._deadline_heap: List[Tuple[datetime, str]] = []
         self.game_settings = get_game_settings()
     
     def _create_initial_room_data(self, room_id: str) -> Dict:
@@ -37,9 +68,91 @@ class RoomLifecycleService:
                 "phase_duration": 0
             },
             "created_at": datetime.now(),
-            "last_activity": datetime.now()
+            "last_activity": datetime.now(),
+            "connected_count": 0,
+            "version": _next_room_version()
         }
     
+    def _schedule_inactivity_check(self, room_id: str, last_activity: datetime) -> None:
+        """Record the activity timestamp the cleanup sweep should next check for a room."""
+        self._scheduled_activity[room_id] = last_activity
+        heapq.heappush(self._activity_heap, (last_activity, room_id))
+    
+    def update_room_indexes(self, room: Dict) -> None:
+        """
+        Refresh the matchmaking and timed-phase indexes after a player or phase change.
+        
+        The activity heap is not refreshed here; it relies on last_activity only
+        increasing (see _activity_heap).
+        """
+        room_id = room["room_id"]
+        game_state = room["game_state"]
+        player_count = len(room["players"])
+        
+        with self._rooms_lock:
+            # The caller holds only the room lock, so the room may have been deleted
+            # (or replaced under the same ID) since it was read; never index it then
+            if self._rooms.get(room_id) is not room:
+                return
+            
+            if (game_state.get("phase") == "waiting" and
+                    1 <= player_count < self.game_settings.max_players_per_room):
+                self._available_rooms[room_id] = None
+            else:
+                self._available_rooms.pop(room_id, None)
+            
+            phase_start = game_state.get("phase_start_time")
+            phase_duration = game_state.get("phase_duration", 0)
+            if phase_start and phase_duration > 0:
+                deadline = phase_start + timedelta(seconds=phase_duration)
+                if self._timed_rooms.get(room_id) != deadline:
+                    self._timed_rooms[room_id] = deadline
+                    heapq.heappush(self._deadline_heap, (deadline, room_id))
+            else:
+                self._timed_rooms.pop(room_id, None)
+    
+    def get_expired_room_ids(self) -> List[str]:
+        """
+        Get rooms whose running phase timer has passed its deadline.
+        
+        Returns:
+            List of room ID strings, earliest deadline first
+        """
+        now = datetime.now()
+        expired = []
+        with self._rooms_lock:
+            while self._deadline_heap and self._deadline_heap[0][0] <= now:
+                deadline, room_id = heapq.heappop(self._deadline_heap)
+                if self._timed_rooms.get(room_id) != deadline:
+                    continue  # Stale entry from a phase that already ended
+                if room_id not in self._rooms:
+                    del self._timed_rooms[room_id]
+                    continue  # Room was deleted; nothing left to time out
+                expired.append((deadline, room_id))
+            
+            # Keep expired deadlines queued until the room moves to a new phase, so a
+            # timeout that fails to advance the room is retried on the next check
+            for entry in expired:
+                heapq.heappush(self._deadline_heap, entry)
+        
+        return [room_id for _, room_id in expired]
+    
+    def find_available_room(self) -> Optional[str]:
+        """
+        Find a room that is waiting for players and has a free slot.
+        
+        Returns:
+            Room ID or None if no room is available
+        """
+        with self._rooms_lock:
+            # Never hand out a room that is no longer registered; drop any such entry
+            while self._available_rooms:
+                room_id = next(iter(self._available_rooms))
+                if room_id in self._rooms:
+                    return room_id
+                del self._available_rooms[room_id]
+            return None
+    
     def create_room(self, room_id: str) -> Dict:
         """
         Create a new game room with the given ID.
@@ -59,6 +172,7 @@ class RoomLifecycleService:
             
             room_data = self._create_initial_room_data(room_id)
             self._rooms[room_id] = room_data
+            self._schedule_inactivity_check(room_id, room_data["last_activity"])
             logger.info(f"Created room {room_id}")
             return room_data.copy()
     
@@ -75,6 +189,9 @@ class RoomLifecycleService:
         with self._rooms_lock:
             if room_id in self._rooms:
                 del self._rooms[room_id]
+                self._scheduled_activity.pop(room_id, None)
+                self._available_rooms.pop(room_id, None)
+                self._timed_rooms.pop(room_id, None)
                 logger.info(f"Deleted room {room_id}")
                 return True
             return False
@@ -99,6 +216,7 @@ class RoomLifecycleService:
                 if room_id not in self._rooms:
                     room_data = self._create_initial_room_data(room_id)
                     self._rooms[room_id] = room_data
+                    self._schedule_inactivity_check(room_id, room_data["last_activity"])
                     logger.info(f"Auto-created room {room_id}")
     
     def get_room_data(self, room_id: str) -> Optional[Dict]:
@@ -132,21 +250,31 @@ class RoomLifecycleService:
         Returns:
             Number of rooms cleaned up
         """
-        from datetime import timedelta
         cutoff_time = datetime.now() - timedelta(minutes=max_inactive_minutes)
         
-        rooms_to_delete = []
-        
-        for room_id, room in self._rooms.items():
-            if room["last_activity"] < cutoff_time:
-                rooms_to_delete.append(room_id)
-        
         cleaned_count = 0
         with self._rooms_lock:
-            for room_id in rooms_to_delete:
-                if room_id in self._rooms:
+            # Only rooms whose last recorded activity is older than the cutoff are
+            # visited. Rooms that have seen activity since are rescheduled with
+            # their current timestamp instead of being deleted.
+            while self._activity_heap and self._activity_heap[0][0] < cutoff_time:
+                scheduled_time, room_id = heapq.heappop(self._activity_heap)
+                if self._scheduled_activity.get(room_id) != scheduled_time:
+                    continue  # Stale entry superseded by a newer one
+                
+                room = self._rooms.get(room_id)
+                if room is None:
+                    del self._scheduled_activity[room_id]
+                    continue
+                
+                if room["last_activity"] < cutoff_time:
                     del self._rooms[room_id]
+                    del self._scheduled_activity[room_id]
+                    self._available_rooms.pop(room_id, None)
+                    self._timed_rooms.pop(room_id, None)
                     cleaned_count += 1
                     logger.info(f"Cleaned up inactive room {room_id}")
+                else:
+                    self._schedule_inactivity_check(room_id, room["last_activity"])
         
-        return cleaned_count
\ No newline at end of file
+        return cleaned_count
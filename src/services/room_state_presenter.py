@@ -7,6 +7,8 @@ to be sent to clients, ensuring consistent payload shapes and proper data filter
 
 from typing import Dict, Any, List, Optional
 
+from src.core.game_phases import PROMPT_PHASES
+
 
 class RoomStatePresenter:
     """Centralized service for transforming room state data for client broadcasts."""
@@ -40,7 +42,7 @@ class RoomStatePresenter:
         }
         
         # Add prompt information for active phases
-        if game_state['phase'] in ['responding', 'guessing', 'results']:
+        if game_state['phase'] in PROMPT_PHASES:
             if game_state['current_prompt']:
                 safe_game_state['current_prompt'] = self._create_safe_prompt_data(game_state['current_prompt'])
         
@@ -6,11 +6,25 @@ Extracted from RoomManager to follow Single Responsibility Principle.
 """
 
 import logging
+import os
 from datetime import datetime
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional
+
+from src.services.room_lifecycle_service import bump_room_version
 
 logger = logging.getLogger(__name__)
 
+# Allowed (current_phase, new_phase) pairs for game state updates
+_VALID_TRANSITIONS = frozenset({
+    ("waiting", "responding"), ("waiting", "waiting"),
+    ("responding", "guessing"), ("responding", "waiting"), ("responding", "responding"),
+    ("guessing", "results"), ("guessing", "responding"), ("guessing", "waiting"), ("guessing", "guessing"),
+    ("results", "waiting"), ("results", "responding"),
+})
+
+_REQUIRED_ROOM_FIELDS = frozenset({'room_id', 'players', 'game_state', 'created_at', 'last_activity'})
+_REQUIRED_GAME_STATE_FIELDS = frozenset({'phase', 'current_prompt', 'responses', 'guesses', 'round_number'})
+
 
 class RoomStateService:
     """Manages room state validation and game state transitions."""
@@ -18,6 +32,9 @@ class RoomStateService:
     def __init__(self, room_lifecycle_service, concurrency_control_service):
         self.room_lifecycle_service = room_lifecycle_service
         self.concurrency_control_service = concurrency_control_service
+        # Post-write consistency checks are redundant on the happy path; only
+        # run them when explicitly debugging state corruption.
+        self._paranoid = __debug__ and os.environ.get("LLMPOSTOR_PARANOID") == "1"
     
     def get_room_state(self, room_id: str) -> Optional[Dict]:
         """
@@ -42,17 +59,12 @@ class RoomStateService:
         
         try:
             # Check required fields
-            required_fields = ['room_id', 'players', 'game_state', 'created_at', 'last_activity']
-            for field in required_fields:
-                if field not in room:
-                    return False
+            if not _REQUIRED_ROOM_FIELDS.issubset(room):
+                return False
             
             # Validate game state structure
-            game_state = room['game_state']
-            required_game_fields = ['phase', 'current_prompt', 'responses', 'guesses', 'round_number']
-            for field in required_game_fields:
-                if field not in game_state:
-                    return False
+            if not _REQUIRED_GAME_STATE_FIELDS.issubset(room['game_state']):
+                return False
             
             # Validate player data consistency
             for player_id, player in room['players'].items():
@@ -70,36 +82,34 @@ class RoomStateService:
         current_phase = room["game_state"].get("phase", "waiting")
         new_phase = game_state.get("phase", current_phase)
         
-        # Define valid phase transitions to prevent invalid state changes
-        valid_transitions = {
-            "waiting": ["responding", "waiting"],
-            "responding": ["guessing", "waiting", "responding"],
-            "guessing": ["results", "responding", "waiting", "guessing"],
-            "results": ["waiting", "responding"]
-        }
-        
-        if new_phase not in valid_transitions.get(current_phase, []):
+        if (current_phase, new_phase) not in _VALID_TRANSITIONS:
             logger.warning(f"Invalid game state transition in room {room_id}: {current_phase} -> {new_phase}")
-            logger.debug(f"Current room phase: {room['game_state']['phase']}, new game_state phase: {game_state['phase']}")
+            logger.debug("Current room phase: %s, new game_state phase: %s", room['game_state']['phase'], game_state['phase'])
             return False
         
         # Validate game state consistency
         try:
-            required_fields = ['phase', 'current_prompt', 'responses', 'guesses', 'round_number']
-            for field in required_fields:
-                if field not in game_state:
+            if not _REQUIRED_GAME_STATE_FIELDS.issubset(game_state):
+                for field in sorted(_REQUIRED_GAME_STATE_FIELDS.difference(game_state)):
                     logger.warning(f"Missing required field {field} in game state update for room {room_id}")
-                    return False
+                return False
         except Exception as e:
             logger.error(f"Game state validation error for room {room_id}: {e}")
             return False
         
         return True
     
-    def update_room_game_state(self, room: Dict, game_state: Dict) -> None:
-        """Update room's game state."""
-        room["game_state"] = game_state.copy()
+    def assign_room_game_state(self, room: Dict, game_state: Dict) -> None:
+        """
+        Assign a new game state to the room without copying it.
+        
+        Caller transfers ownership of game_state; callers that may mutate it
+        after the call must pass a copy.
+        """
+        room["game_state"] = game_state
+        bump_room_version(room)
         room["last_activity"] = datetime.now()
+        self.room_lifecycle_service.update_room_indexes(room)
     
     def update_game_state(self, room_id: str, game_state: Dict) -> bool:
         """
@@ -120,9 +130,9 @@ class RoomStateService:
             if not self.validate_game_state_transition(room, game_state, room_id):
                 return False
             
-            self.update_room_game_state(room, game_state)
+            self.assign_room_game_state(room, game_state)
             
-            if not self.validate_room_state_consistency(room_id):
+            if self._paranoid and not self.validate_room_state_consistency(room_id):
                 logger.error(f"Room state became inconsistent after game state update in {room_id}")
                 return False
             
@@ -146,6 +156,36 @@ class RoomStateService:
             room["last_activity"] = datetime.now()
             return True
     
+    def apply_batch(self, room_id: str, mutators: List[Callable[[Dict], None]]) -> Optional[Dict]:
+        """
+        Apply several mutations to a room under a single lock acquisition.
+        
+        Each mutator receives the live room dict. The activity timestamp is
+        stamped once after all mutators have run. Room locks are not
+        re-entrant, so mutators must not call back into room operations.
+        Mutators must not change the game phase: the transition checks only
+        run in update_game_state.
+        
+        Args:
+            room_id: ID of the room
+            mutators: Callables applied in order to the live room dict
+            
+        Returns:
+            Snapshot of the room after the batch, or None if room doesn't exist
+        """
+        with self.concurrency_control_service.room_operation(room_id):
+            room = self.room_lifecycle_service.get_room_data(room_id)
+            if not room:
+                return None
+            
+            for mutator in mutators:
+                mutator(room)
+            
+            bump_room_version(room)
+            room["last_activity"] = datetime.now()
+            self.room_lifecycle_service.update_room_indexes(room)
+            return room.copy()
+    
     def validate_room_consistency(self, room_id: str) -> None:
         """Validate room state consistency, raising ValueError if invalid."""
         if not self.validate_room_state_consistency(room_id):
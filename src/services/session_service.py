@@ -38,7 +38,7 @@ class SessionService:
                 'player_id': player_id,
                 'player_name': player_name
             }
-            logger.debug(f"Created session for player {player_name} ({player_id}) in room {room_id}")
+            logger.debug("Created session for player %s (%s) in room %s", player_name, player_id, room_id)
             
         except Exception as e:
             logger.error(f"Error creating session for socket {socket_id}: {e}")
@@ -95,7 +95,7 @@ class SessionService:
         try:
             session_info = self._player_sessions.pop(socket_id, None)
             if session_info:
-                logger.debug(f"Removed session for player {session_info['player_name']} ({session_info['player_id']})")
+                logger.debug("Removed session for player %s (%s)", session_info['player_name'], session_info['player_id'])
             return session_info
             
         except Exception as e:
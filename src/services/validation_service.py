@@ -5,6 +5,7 @@ Provides input validation and sanitization functionality separated from error re
 """
 
 import logging
+import os
 import re
 import html
 import json
@@ -53,7 +54,6 @@ class ValidationService:
             return config.max_response_length
         except Exception:
             # Fallback to environment variable if config not available
-            import os
             try:
                 return int(os.environ.get('MAX_RESPONSE_LENGTH', 100))
             except (ValueError, TypeError):
@@ -497,10 +497,6 @@ class EventManager extends IServiceModule {
             'guess_submitted': (data) => this._handleGuessSubmitted(data),
             'results_phase_started': (data) => this._handleResultsPhaseStarted(data),
             
-            // Timer and countdown handlers
-            'countdown_update': (data) => this._handleCountdownUpdate(data),
-            'time_warning': (data) => this._handleTimeWarning(data),
-            
             // Game flow handlers
             'game_paused': (data) => this._handleGamePaused(data),
             'round_ended': (data) => this._handleRoundEnded(data),
@@ -895,15 +891,6 @@ class EventManager extends IServiceModule {
         this.timer.startTimer('results', data.phase_duration || 30);
     }
     
-    _handleCountdownUpdate(data) {
-        this.timer.updateTimer(data.phase, data.time_remaining, data.phase_duration);
-    }
-    
-    _handleTimeWarning(data) {
-        this.toast.warning(data.message);
-        this.ui.flashTimer(data.phase);
-    }
-    
     _handleGamePaused(data) {
         console.log('Game paused:', data);
         
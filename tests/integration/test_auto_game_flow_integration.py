@@ -77,10 +77,7 @@ class TestAutoGameFlowIntegration:
             with patch('src.services.auto_game_flow_service.get_config') as mock_config_func:
                 mock_config = Mock()
                 mock_config.game_flow_check_interval = 0.1  # 100ms for fast testing
-                mock_config.countdown_broadcast_interval = 0.2  # 200ms intervals
                 mock_config.room_status_broadcast_interval = 1
-                mock_config.warning_threshold_seconds = 5
-                mock_config.final_warning_threshold_seconds = 2
                 mock_config.room_cleanup_inactive_minutes = 60
                 mock_config.min_players_required = 2
                 mock_config_func.return_value = mock_config
@@ -100,20 +97,15 @@ class TestAutoGameFlowIntegration:
                     client1_events = self.client.get_received()
                     client2_events = client2.get_received()
 
-                    # Should have received countdown updates due to timer coordination
-                    countdown_events_1 = [e for e in client1_events if e['name'] == 'countdown_update']
-                    countdown_events_2 = [e for e in client2_events if e['name'] == 'countdown_update']
+                    # The round start carries the phase duration so clients can count down locally
+                    round_started = [e for e in client1_events if e['name'] == 'round_started']
+                    assert len(round_started) > 0, "Client 1 should receive the round start"
+                    assert 'phase_duration' in round_started[0]['args'][0]
 
-                    # Both clients should receive countdown updates from the coordinated service
-                    assert len(countdown_events_1) > 0, "Client 1 should receive countdown updates"
-                    assert len(countdown_events_2) > 0, "Client 2 should receive countdown updates"
-
-                    # Verify countdown data structure
-                    if countdown_events_1:
-                        countdown_data = countdown_events_1[0]['args'][0]
-                        assert 'phase' in countdown_data
-                        assert 'time_remaining' in countdown_data
-                        assert 'phase_duration' in countdown_data
+                    # The coordinated service does not stream countdowns while the phase runs
+                    event_names = [e['name'] for e in client1_events + client2_events]
+                    assert 'countdown_update' not in event_names
+                    assert 'time_warning' not in event_names
 
                 finally:
                     auto_flow.stop()
@@ -155,10 +147,7 @@ class TestAutoGameFlowIntegration:
             with patch('src.services.auto_game_flow_service.get_config') as mock_config_func:
                 mock_config = Mock()
                 mock_config.game_flow_check_interval = 0.05  # Very fast for testing
-                mock_config.countdown_broadcast_interval = 0.1
                 mock_config.room_status_broadcast_interval = 1
-                mock_config.warning_threshold_seconds = 30
-                mock_config.final_warning_threshold_seconds = 10
                 mock_config.room_cleanup_inactive_minutes = 60
                 mock_config.min_players_required = 2
                 mock_config_func.return_value = mock_config
@@ -220,10 +209,7 @@ class TestAutoGameFlowIntegration:
         with patch('src.services.auto_game_flow_service.get_config') as mock_config_func:
             mock_config = Mock()
             mock_config.game_flow_check_interval = 0.1
-            mock_config.countdown_broadcast_interval = 10
             mock_config.room_status_broadcast_interval = 0.2  # Cleanup check every 200ms
-            mock_config.warning_threshold_seconds = 30
-            mock_config.final_warning_threshold_seconds = 10
             mock_config.room_cleanup_inactive_minutes = 0.001  # Very aggressive cleanup (0.06 seconds)
             mock_config.min_players_required = 2
             mock_config_func.return_value = mock_config
@@ -257,10 +243,7 @@ class TestAutoGameFlowIntegration:
         with patch('src.services.auto_game_flow_service.get_config') as mock_config_func:
             mock_config = Mock()
             mock_config.game_flow_check_interval = 0.1
-            mock_config.countdown_broadcast_interval = 10
             mock_config.room_status_broadcast_interval = 1
-            mock_config.warning_threshold_seconds = 30
-            mock_config.final_warning_threshold_seconds = 10
             mock_config.room_cleanup_inactive_minutes = 60
             mock_config.min_players_required = 2
             mock_config_func.return_value = mock_config
@@ -308,25 +291,22 @@ class TestAutoGameFlowIntegration:
             'player_name': 'ErrorPlayer'
         })
 
-        # Mock game manager to throw errors periodically
-        original_is_phase_expired = game_manager.is_phase_expired
+        # Mock room manager to throw errors periodically
+        original_get_expired_room_ids = room_manager.get_expired_room_ids
         call_count = 0
 
-        def failing_is_phase_expired(room_id):
+        def failing_get_expired_room_ids():
             nonlocal call_count
             call_count += 1
             if call_count == 2:  # Fail on second call
                 raise Exception("Simulated error")
-            return original_is_phase_expired(room_id)
+            return original_get_expired_room_ids()
 
-        with patch.object(game_manager, 'is_phase_expired', side_effect=failing_is_phase_expired):
+        with patch.object(room_manager, 'get_expired_room_ids', side_effect=failing_get_expired_room_ids):
             with patch('src.services.auto_game_flow_service.get_config') as mock_config_func:
                 mock_config = Mock()
                 mock_config.game_flow_check_interval = 0.1
-                mock_config.countdown_broadcast_interval = 10
                 mock_config.room_status_broadcast_interval = 1
-                mock_config.warning_threshold_seconds = 30
-                mock_config.final_warning_threshold_seconds = 10
                 mock_config.room_cleanup_inactive_minutes = 60
                 mock_config.min_players_required = 2
                 mock_config_func.return_value = mock_config
@@ -378,10 +358,7 @@ class TestAutoGameFlowIntegration:
             with patch('src.services.auto_game_flow_service.get_config') as mock_config_func:
                 mock_config = Mock()
                 mock_config.game_flow_check_interval = 0.1
-                mock_config.countdown_broadcast_interval = 0.2
                 mock_config.room_status_broadcast_interval = 1
-                mock_config.warning_threshold_seconds = 30
-                mock_config.final_warning_threshold_seconds = 10
                 mock_config.room_cleanup_inactive_minutes = 60
                 mock_config.min_players_required = 2
                 mock_config_func.return_value = mock_config
@@ -420,16 +397,14 @@ class TestAutoGameFlowIntegration:
                     final_events_1 = self.client.get_received()
                     final_events_2 = client2.get_received()
 
-                    # Should have received some coordination events
                     all_events = final_events_1 + final_events_2
                     event_names = [e['name'] for e in all_events]
 
-                    # Should have received updates through service coordination
-                    coordination_events = [name for name in event_names if name in [
-                        'countdown_update', 'room_state_updated', 'player_list_updated'
-                    ]]
-
-                    assert len(coordination_events) > 0, "Should receive coordination events between services"
+                    # Both players are still connected, so the round keeps running and the
+                    # service sends no per-tick countdown traffic while it does
+                    assert 'countdown_update' not in event_names
+                    room_state = room_manager.get_room_state('coordination-room')
+                    assert room_state['game_state']['phase'] == 'responding'
 
                 finally:
                     auto_flow.stop()
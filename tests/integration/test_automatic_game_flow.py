@@ -226,11 +226,12 @@ class TestAutomaticGameFlow:
             # Advance to results phase manually
             game_manager.advance_game_phase('test_room')
             
-            # Manually set a very short phase duration for testing
-            room_state = room_manager.get_room_state('test_room')
-            room_state['game_state']['phase_duration'] = 1  # 1 second
-            room_state['game_state']['phase_start_time'] = datetime.now() - timedelta(seconds=2)  # Already expired
-            room_manager.update_game_state('test_room', room_state['game_state'])
+            # Manually set a very short phase duration for testing. A results -> results
+            # update is not a valid transition, so expire the timer in a batch instead
+            def expire_phase(room):
+                room['game_state']['phase_duration'] = 1  # 1 second
+                room['game_state']['phase_start_time'] = datetime.now() - timedelta(seconds=2)  # Already expired
+            room_manager.apply_batch('test_room', [expire_phase])
             
             # Wait for automatic phase transition
             time.sleep(1.0)  # Wait longer for timer to check
@@ -256,8 +257,8 @@ class TestAutomaticGameFlow:
         finally:
             client2.disconnect()
     
-    def test_countdown_timer_updates(self, client, mock_content_manager, test_auto_flow_service):
-        """Test that countdown timer updates are broadcasted during timed phases."""
+    def test_no_countdown_broadcasts_during_timed_phases(self, client, mock_content_manager, test_auto_flow_service):
+        """Test that timed phases are counted down by clients rather than broadcast per tick."""
         client2 = socketio.test_client(app)
         
         try:
@@ -267,26 +268,14 @@ class TestAutomaticGameFlow:
             client.get_received()
             client2.get_received()
             
-            # Wait for countdown updates (should happen every 10 seconds, but we'll wait less)
+            # Let the timer loop run a few ticks
             time.sleep(0.2)  # Wait for timer to run
             
-            # Check for countdown_update events
             received1 = client.get_received()
             received2 = client2.get_received()
             
-            countdown_events1 = [event for event in received1 if event['name'] == 'countdown_update']
-            countdown_events2 = [event for event in received2 if event['name'] == 'countdown_update']
-            
-            # Note: Countdown updates happen every 10 seconds, so we might not see them in this short test
-            # But the structure should be correct if they do appear
-            if countdown_events1 or countdown_events2:
-                countdown_event = countdown_events1[0] if countdown_events1 else countdown_events2[0]
-                event_data = countdown_event['args'][0]
-                
-                assert 'phase' in event_data
-                assert 'time_remaining' in event_data
-                assert 'phase_duration' in event_data
-                assert event_data['phase'] == 'responding'
+            event_names = [event['name'] for event in received1 + received2]
+            assert 'countdown_update' not in event_names
             
         finally:
             client2.disconnect()
@@ -346,19 +335,17 @@ class TestAutomaticGameFlow:
         # Verify room exists
         assert room_manager.room_exists('test_room')
         
-        # Manually set room as very old
-        room_state = room_manager.get_room_state('test_room')
-        room_state['last_activity'] = datetime.now() - timedelta(hours=2)  # 2 hours ago
-        room_manager._rooms['test_room'] = room_state
-        
-        # Trigger cleanup manually (normally happens every minute)
-        test_auto_flow_service._cleanup_inactive_rooms()
+        # Trigger cleanup manually (normally happens every minute) two hours from now
+        later = datetime.now() + timedelta(hours=2)
+        with patch('src.services.room_lifecycle_service.datetime') as mock_datetime:
+            mock_datetime.now.return_value = later
+            test_auto_flow_service._cleanup_inactive_rooms()
         
         # Verify room was cleaned up
         assert not room_manager.room_exists('test_room')
     
-    def test_time_warning_broadcasts(self, client, mock_content_manager, test_auto_flow_service):
-        """Test that time warning events are broadcasted when time is low."""
+    def test_no_time_warning_broadcasts(self, client, mock_content_manager, test_auto_flow_service):
+        """Test that low-time warnings are left to the client timer."""
         client2 = socketio.test_client(app)
         
         try:
@@ -374,25 +361,15 @@ class TestAutomaticGameFlow:
             client.get_received()
             client2.get_received()
             
-            # Wait for timer to check and potentially send warnings
+            # Let the timer loop tick with little time remaining
             time.sleep(0.2)
             
-            # Note: Time warnings are sent when time_remaining is between 25-30 or 5-10 seconds
-            # Since we set it to 25 seconds remaining, we might get a 30-second warning
+            # The client raises its own 30s/10s warnings from the phase duration
             received1 = client.get_received()
             received2 = client2.get_received()
             
-            warning_events1 = [event for event in received1 if event['name'] == 'time_warning']
-            warning_events2 = [event for event in received2 if event['name'] == 'time_warning']
-            
-            # Warnings might not appear in this short test window, but structure should be correct
-            if warning_events1 or warning_events2:
-                warning_event = warning_events1[0] if warning_events1 else warning_events2[0]
-                event_data = warning_event['args'][0]
-                
-                assert 'message' in event_data
-                assert 'time_remaining' in event_data
-                assert 'remaining' in event_data['message']
+            event_names = [event['name'] for event in received1 + received2]
+            assert 'time_warning' not in event_names
             
         finally:
             client2.disconnect()
@@ -320,7 +320,7 @@ class TestDisconnectBroadcastIntegration:
         }
 
         # Mock the room state and presenter for integration testing
-        with patch.object(self.room_manager, 'get_connected_players') as mock_connected:
+        with patch.object(self.room_manager, 'get_connected_players_readonly') as mock_connected:
             mock_connected.return_value = [{'player_id': bob_data['player_id'], 'name': 'Bob', 'score': 0, 'connected': True}]
 
             with patch.object(self.room_state_presenter, 'create_player_list_update') as mock_presenter:
@@ -9,6 +9,7 @@ import pytest
 from unittest.mock import Mock, patch, MagicMock
 from flask import Flask
 
+from src.room_manager import RoomManager
 from src.routes.api import create_api_blueprint
 
 
@@ -111,20 +112,7 @@ class TestFindAvailableRoomRoute:
 
     def test_find_available_room_success(self):
         """Test finding an available room successfully"""
-        # Setup mock room manager
-        self.mock_room_manager.get_all_rooms.return_value = ['room1', 'room2']
-        self.mock_room_manager.get_room_state.side_effect = [
-            # First room - not waiting phase
-            {
-                'game_state': {'phase': 'playing'},
-                'players': {'player1': {}, 'player2': {}}
-            },
-            # Second room - waiting phase with space
-            {
-                'game_state': {'phase': 'waiting'},
-                'players': {'player1': {}, 'player2': {}}
-            }
-        ]
+        self.mock_room_manager.find_available_room.return_value = 'room2'
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -134,18 +122,34 @@ class TestFindAvailableRoomRoute:
             data = response.get_json()
             assert data == {'room_id': 'room2'}
 
-            # Verify room manager calls
-            self.mock_room_manager.get_all_rooms.assert_called_once()
-            assert self.mock_room_manager.get_room_state.call_count == 2
+            # Verify the index is used instead of scanning room states
+            self.mock_room_manager.find_available_room.assert_called_once()
+            self.mock_room_manager.get_all_rooms.assert_not_called()
+            self.mock_room_manager.get_room_state.assert_not_called()
+
+    def test_find_available_room_none_available(self):
+        """Test behavior when no room is available"""
+        self.mock_room_manager.find_available_room.return_value = None
+
+        with self.app.test_client() as client:
+            response = client.get('/api/find-available-room')
+
+            # Should return None
+            assert response.status_code == 200
+            data = response.get_json()
+            assert data == {'room_id': None}
+
+    def _use_real_room_manager(self):
+        """Serve the route from a real RoomManager so its matchmaking index is exercised"""
+        self.room_manager = RoomManager()
+        self.app = Flask(__name__)
+        self.app.register_blueprint(create_api_blueprint({'room_manager': self.room_manager}))
 
     def test_find_available_room_requires_minimum_players(self):
         """Test that rooms must have at least 1 player to be considered available"""
         # Setup room with no players
-        self.mock_room_manager.get_all_rooms.return_value = ['empty_room']
-        self.mock_room_manager.get_room_state.return_value = {
-            'game_state': {'phase': 'waiting'},
-            'players': {}  # No players
-        }
+        self._use_real_room_manager()
+        self.room_manager.create_room('empty_room')
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -158,12 +162,9 @@ class TestFindAvailableRoomRoute:
     def test_find_available_room_excludes_full_rooms(self):
         """Test that full rooms (8+ players) are not considered available"""
         # Setup full room
-        self.mock_room_manager.get_all_rooms.return_value = ['full_room']
-        players = {f'player{i}': {} for i in range(8)}  # 8 players (full)
-        self.mock_room_manager.get_room_state.return_value = {
-            'game_state': {'phase': 'waiting'},
-            'players': players
-        }
+        self._use_real_room_manager()
+        for i in range(8):  # 8 players (full)
+            self.room_manager.add_player_to_room('full_room', f'player{i}', f'socket{i}')
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -176,11 +177,12 @@ class TestFindAvailableRoomRoute:
     def test_find_available_room_only_waiting_phase(self):
         """Test that only rooms in waiting phase are considered"""
         # Setup room in playing phase
-        self.mock_room_manager.get_all_rooms.return_value = ['playing_room']
-        self.mock_room_manager.get_room_state.return_value = {
-            'game_state': {'phase': 'playing'},
-            'players': {'player1': {}, 'player2': {}}
-        }
+        self._use_real_room_manager()
+        self.room_manager.add_player_to_room('playing_room', 'player1', 'socket1')
+        self.room_manager.add_player_to_room('playing_room', 'player2', 'socket2')
+        game_state = self.room_manager.get_room_state('playing_room')['game_state'].copy()
+        game_state['phase'] = 'responding'
+        assert self.room_manager.update_game_state('playing_room', game_state)
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -192,7 +194,7 @@ class TestFindAvailableRoomRoute:
 
     def test_find_available_room_no_rooms_exist(self):
         """Test behavior when no rooms exist"""
-        self.mock_room_manager.get_all_rooms.return_value = []
+        self._use_real_room_manager()
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -203,25 +205,11 @@ class TestFindAvailableRoomRoute:
             assert data == {'room_id': None}
 
     def test_find_available_room_handles_none_room_state(self):
-        """Test handling of rooms that return None for room state"""
-        self.mock_room_manager.get_all_rooms.return_value = ['invalid_room']
-        self.mock_room_manager.get_room_state.return_value = None
-
-        with self.app.test_client() as client:
-            response = client.get('/api/find-available-room')
-
-            # Should return None
-            assert response.status_code == 200
-            data = response.get_json()
-            assert data == {'room_id': None}
-
-    def test_find_available_room_handles_malformed_room_state(self):
-        """Test handling of rooms with malformed state data"""
-        self.mock_room_manager.get_all_rooms.return_value = ['malformed_room']
-        self.mock_room_manager.get_room_state.return_value = {
-            # Missing game_state or players
-            'some_other_data': 'value'
-        }
+        """Test handling of rooms that no longer have a room state"""
+        self._use_real_room_manager()
+        self.room_manager.add_player_to_room('invalid_room', 'player1', 'socket1')
+        # Remove the room behind the matchmaking index's back
+        del self.room_manager.lifecycle._rooms['invalid_room']
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -234,7 +222,7 @@ class TestFindAvailableRoomRoute:
     @patch('src.routes.api.logger')
     def test_find_available_room_handles_room_manager_error(self, mock_logger):
         """Test error handling when room manager raises exception"""
-        self.mock_room_manager.get_all_rooms.side_effect = Exception("Room manager error")
+        self.mock_room_manager.find_available_room.side_effect = Exception("Room manager error")
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -251,12 +239,7 @@ class TestFindAvailableRoomRoute:
     @patch('src.routes.api.logger')
     def test_find_available_room_logs_success(self, mock_logger):
         """Test that successful room finding is logged"""
-        # Setup available room
-        self.mock_room_manager.get_all_rooms.return_value = ['room1']
-        self.mock_room_manager.get_room_state.return_value = {
-            'game_state': {'phase': 'waiting'},
-            'players': {'player1': {}, 'player2': {}}
-        }
+        self.mock_room_manager.find_available_room.return_value = 'room1'
 
         with self.app.test_client() as client:
             response = client.get('/api/find-available-room')
@@ -264,7 +247,7 @@ class TestFindAvailableRoomRoute:
             # Should log the found room
             assert response.status_code == 200
             mock_logger.info.assert_called_once()
-            assert "Found available room: room1 with 2 players" in mock_logger.info.call_args[0][0]
+            assert "Found available room: room1" in mock_logger.info.call_args[0][0]
 
 
 class TestRoomRoute:
@@ -274,6 +257,9 @@ class TestRoomRoute:
         """Setup test fixtures"""
         self.app = Flask(__name__)
         self.mock_room_manager = Mock()
+
+    def _register_blueprint(self):
+        """Create and register the blueprint (resolves max response length)"""
         services = {'room_manager': self.mock_room_manager}
         self.blueprint = create_api_blueprint(services)
         self.app.register_blueprint(self.blueprint)
@@ -287,6 +273,7 @@ class TestRoomRoute:
         mock_service_instance.get_max_response_length.return_value = 150
         mock_validation_service.return_value = mock_service_instance
         mock_render_template.return_value = "<html>Game Room</html>"
+        self._register_blueprint()
 
         with self.app.test_client() as client:
             response = client.get('/test-room-123')
@@ -302,55 +289,47 @@ class TestRoomRoute:
 
     @patch('src.routes.api.render_template')
     @patch('src.services.validation_service.ValidationService')
-    def test_room_route_gets_max_response_length(self, mock_validation_service, mock_render_template):
-        """Test that room route properly retrieves max response length from validation service"""
+    def test_room_route_resolves_max_response_length_once(self, mock_validation_service, mock_render_template):
+        """Test that max response length is resolved at blueprint creation, not per request"""
         # Setup mocks
         mock_service_instance = Mock()
         mock_service_instance.get_max_response_length.return_value = 200
         mock_validation_service.return_value = mock_service_instance
         mock_render_template.return_value = "<html>Game Room</html>"
+        self._register_blueprint()
 
         with self.app.test_client() as client:
-            response = client.get('/room-456')
+            client.get('/room-456')
+            client.get('/room-789')
 
-            # Verify validation service was called
+            # Verify validation service was only consulted once
             mock_validation_service.assert_called_once()
             mock_service_instance.get_max_response_length.assert_called_once()
 
             # Verify correct max_response_length passed to template
-            mock_render_template.assert_called_once_with(
+            mock_render_template.assert_called_with(
                 'game.html',
-                room_id='room-456',
+                room_id='room-789',
                 max_response_length=200
             )
 
-    @patch('src.routes.api.render_template')
     @patch('src.services.validation_service.ValidationService')
-    def test_room_route_handles_validation_service_error(self, mock_validation_service, mock_render_template):
-        """Test room route handles validation service initialization errors"""
-        # Setup validation service to raise error
+    def test_blueprint_creation_fails_on_validation_service_error(self, mock_validation_service):
+        """Test validation service initialization errors surface at blueprint creation"""
         mock_validation_service.side_effect = Exception("Validation service error")
-        mock_render_template.return_value = "<html>Game Room</html>"
 
-        with self.app.test_client() as client:
-            # Should return 500 due to validation service error
-            response = client.get('/error-room')
-            assert response.status_code == 500
+        with pytest.raises(Exception, match="Validation service error"):
+            self._register_blueprint()
 
-    @patch('src.routes.api.render_template')
     @patch('src.services.validation_service.ValidationService')
-    def test_room_route_handles_get_max_response_length_error(self, mock_validation_service, mock_render_template):
-        """Test room route handles max response length retrieval errors"""
-        # Setup validation service instance to raise error on method call
+    def test_blueprint_creation_fails_on_get_max_response_length_error(self, mock_validation_service):
+        """Test max response length retrieval errors surface at blueprint creation"""
         mock_service_instance = Mock()
         mock_service_instance.get_max_response_length.side_effect = Exception("Max length error")
         mock_validation_service.return_value = mock_service_instance
-        mock_render_template.return_value = "<html>Game Room</html>"
 
-        with self.app.test_client() as client:
-            # Should return 500 due to max length error
-            response = client.get('/length-error-room')
-            assert response.status_code == 500
+        with pytest.raises(Exception, match="Max length error"):
+            self._register_blueprint()
 
     @patch('src.routes.api.render_template')
     @patch('src.services.validation_service.ValidationService')
@@ -361,6 +340,7 @@ class TestRoomRoute:
         mock_service_instance.get_max_response_length.return_value = 100
         mock_validation_service.return_value = mock_service_instance
         mock_render_template.side_effect = Exception("Template error")
+        self._register_blueprint()
 
         with self.app.test_client() as client:
             response = client.get('/template-error-room')
@@ -376,6 +356,7 @@ class TestRoomRoute:
         mock_service_instance.get_max_response_length.return_value = 100
         mock_validation_service.return_value = mock_service_instance
         mock_render_template.return_value = "<html>Special Room</html>"
+        self._register_blueprint()
 
         # Test with various special characters that might appear in URLs
         test_room_ids = [
@@ -421,16 +402,15 @@ class TestApiRoutesIntegration:
                 assert response.status_code == 200
 
             # Test find available room route exists
-            self.mock_room_manager.get_all_rooms.return_value = []
+            self.mock_room_manager.find_available_room.return_value = None
             response = client.get('/api/find-available-room')
             assert response.status_code == 200
 
             # Test room route exists
             with patch('src.routes.api.render_template') as mock_render:
-                with patch('src.services.validation_service.ValidationService'):
-                    mock_render.return_value = "room"
-                    response = client.get('/test-room')
-                    assert response.status_code == 200
+                mock_render.return_value = "room"
+                response = client.get('/test-room')
+                assert response.status_code == 200
 
     def test_blueprint_url_prefix_handling(self):
         """Test that routes work correctly with potential URL prefixes"""
@@ -449,12 +429,11 @@ class TestApiRoutesIntegration:
                 response = client.get('/game/')
                 assert response.status_code == 200
 
-            self.mock_room_manager.get_all_rooms.return_value = []
+            self.mock_room_manager.find_available_room.return_value = None
             response = client.get('/game/api/find-available-room')
             assert response.status_code == 200
 
             with patch('src.routes.api.render_template') as mock_render:
-                with patch('src.services.validation_service.ValidationService'):
-                    mock_render.return_value = "room"
-                    response = client.get('/game/test-room')
-                    assert response.status_code == 200
\ No newline at end of file
+                mock_render.return_value = "room"
+                response = client.get('/game/test-room')
+                assert response.status_code == 200
\ No newline at end of file
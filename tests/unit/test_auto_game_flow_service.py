@@ -5,10 +5,9 @@ Part 2: Threading - Background thread management, timer service integration, thr
 """
 
 import pytest
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import Mock, MagicMock, patch
 import time
 import threading
-from datetime import datetime
 
 from src.services.auto_game_flow_service import AutoGameFlowService
 from tests.helpers.socket_mocks import create_mock_socketio
@@ -28,10 +27,7 @@ class TestAutoGameFlowServiceCoreLogic:
         # Create mock configuration
         self.mock_config = Mock()
         self.mock_config.game_flow_check_interval = 1
-        self.mock_config.countdown_broadcast_interval = 10
         self.mock_config.room_status_broadcast_interval = 60
-        self.mock_config.warning_threshold_seconds = 30
-        self.mock_config.final_warning_threshold_seconds = 10
         self.mock_config.room_cleanup_inactive_minutes = 60
         self.mock_config.min_players_required = 2
 
@@ -53,10 +49,7 @@ class TestAutoGameFlowServiceCoreLogic:
     def test_initialization_sets_config_values(self):
         """Test that service initializes with correct configuration values"""
         assert self.service.check_interval == 1
-        assert self.service.countdown_broadcast_interval == 10
         assert self.service.room_status_broadcast_interval == 60
-        assert self.service.warning_threshold_seconds == 30
-        assert self.service.final_warning_threshold_seconds == 10
         assert self.service.room_cleanup_inactive_minutes == 60
         assert self.service.min_players_required == 2
 
@@ -74,41 +67,33 @@ class TestAutoGameFlowServiceCoreLogic:
 
         assert not self.service.running
 
-    def test_check_phase_timeouts_processes_all_rooms(self):
-        """Test that phase timeout checking processes all active rooms"""
-        # Setup mock rooms
-        room_ids = ["room1", "room2", "room3"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # Mock phase expiration - only room2 is expired
-        self.mock_game_manager.is_phase_expired.side_effect = [False, True, False]
+    def test_check_phase_timeouts_processes_expired_rooms(self):
+        """Test that phase timeout checking handles the rooms reported as expired"""
+        self.mock_room_manager.get_expired_room_ids.return_value = ["room2"]
 
         # Mock handle phase timeout
         with patch.object(self.service, '_handle_phase_timeout') as mock_handle:
             self.service._check_phase_timeouts()
 
-            # Verify all rooms were checked
-            assert self.mock_game_manager.is_phase_expired.call_count == 3
-            self.mock_game_manager.is_phase_expired.assert_any_call("room1")
-            self.mock_game_manager.is_phase_expired.assert_any_call("room2")
-            self.mock_game_manager.is_phase_expired.assert_any_call("room3")
-
             # Verify only expired room was handled
             mock_handle.assert_called_once_with("room2")
 
+        # Deadlines come from the expiry queue; no per-room state lookups
+        self.mock_game_manager.is_phase_expired.assert_not_called()
+        self.mock_room_manager.get_room_state.assert_not_called()
+
     def test_check_phase_timeouts_handles_exceptions(self):
         """Test that phase timeout checking handles exceptions gracefully"""
-        room_ids = ["room1", "room2"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
+        self.mock_room_manager.get_expired_room_ids.return_value = ["room1", "room2"]
 
         # First room throws exception, second should still be processed
-        self.mock_game_manager.is_phase_expired.side_effect = [Exception("Test error"), False]
-
-        # Should not raise exception
-        self.service._check_phase_timeouts()
+        with patch.object(self.service, '_handle_phase_timeout',
+                          side_effect=[Exception("Test error"), None]) as mock_handle:
+            # Should not raise exception
+            self.service._check_phase_timeouts()
 
-        # Verify both rooms were attempted
-        assert self.mock_game_manager.is_phase_expired.call_count == 2
+            # Verify both rooms were attempted
+            assert mock_handle.call_count == 2
 
     def test_handle_phase_timeout_advances_phase(self):
         """Test that phase timeout handler advances the game phase"""
@@ -210,175 +195,6 @@ class TestAutoGameFlowServiceCoreLogic:
         # Should not raise exception
         self.service._cleanup_inactive_rooms()
 
-    def test_broadcast_countdown_updates_filters_by_interval(self):
-        """Test that countdown updates respect broadcast interval"""
-        room_ids = ["room1"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # Setup room state with responding phase
-        room_state = {
-            "game_state": {
-                "phase": "responding",
-                "phase_duration": 180
-            }
-        }
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_game_manager.get_phase_time_remaining.return_value = 120
-
-        current_time = time.time()
-        last_broadcast = {"room1": current_time - 5}  # 5 seconds ago, less than interval
-
-        self.service._broadcast_countdown_updates(current_time, last_broadcast)
-
-        # Should not broadcast due to interval
-        self.mock_broadcast_service.emit_to_room.assert_not_called()
-
-    def test_broadcast_countdown_updates_sends_for_timed_phases(self):
-        """Test that countdown updates are sent for responding and guessing phases"""
-        room_ids = ["room1", "room2"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # Setup room states
-        room_states = [
-            {"game_state": {"phase": "responding", "phase_duration": 180}},
-            {"game_state": {"phase": "guessing", "phase_duration": 120}}
-        ]
-        self.mock_room_manager.get_room_state.side_effect = room_states
-        self.mock_game_manager.get_phase_time_remaining.side_effect = [120, 90]
-
-        current_time = time.time()
-        last_broadcast = {}  # No previous broadcasts
-
-        self.service._broadcast_countdown_updates(current_time, last_broadcast)
-
-        # Verify countdown updates sent for both rooms
-        assert self.mock_broadcast_service.emit_to_room.call_count == 2
-
-        # Check first room call
-        first_call = self.mock_broadcast_service.emit_to_room.call_args_list[0]
-        assert first_call[0][0] == 'countdown_update'
-        assert first_call[0][1] == {
-            'phase': 'responding',
-            'time_remaining': 120,
-            'phase_duration': 180
-        }
-        assert first_call[0][2] == 'room1'
-
-        # Check second room call
-        second_call = self.mock_broadcast_service.emit_to_room.call_args_list[1]
-        assert second_call[0][0] == 'countdown_update'
-        assert second_call[0][1] == {
-            'phase': 'guessing',
-            'time_remaining': 90,
-            'phase_duration': 120
-        }
-        assert second_call[0][2] == 'room2'
-
-    def test_broadcast_countdown_updates_skips_non_timed_phases(self):
-        """Test that countdown updates are not sent for waiting/results phases"""
-        room_ids = ["room1", "room2"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # Setup room states with non-timed phases
-        room_states = [
-            {"game_state": {"phase": "waiting"}},
-            {"game_state": {"phase": "results"}}
-        ]
-        self.mock_room_manager.get_room_state.side_effect = room_states
-
-        current_time = time.time()
-        last_broadcast = {}
-
-        self.service._broadcast_countdown_updates(current_time, last_broadcast)
-
-        # No countdown updates should be sent
-        self.mock_broadcast_service.emit_to_room.assert_not_called()
-
-    def test_broadcast_countdown_updates_sends_time_warnings(self):
-        """Test that time warnings are sent at appropriate thresholds"""
-        room_ids = ["room1"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # Setup room state with low time remaining
-        room_state = {
-            "game_state": {
-                "phase": "responding",
-                "phase_duration": 180
-            }
-        }
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_game_manager.get_phase_time_remaining.return_value = 28  # Between 30 and 25 (30-5), triggers warning
-
-        current_time = time.time()
-        last_broadcast = {}
-
-        self.service._broadcast_countdown_updates(current_time, last_broadcast)
-
-        # Verify countdown update and warning were sent
-        assert self.mock_broadcast_service.emit_to_room.call_count == 2
-
-        # Check warning call
-        warning_call = self.mock_broadcast_service.emit_to_room.call_args_list[1]
-        assert warning_call[0][0] == 'time_warning'
-        assert warning_call[0][1] == {
-            'message': '30 seconds remaining!',
-            'time_remaining': 28
-        }
-        assert warning_call[0][2] == 'room1'
-
-    def test_broadcast_countdown_updates_sends_final_warning(self):
-        """Test that final warning is sent at final threshold"""
-        room_ids = ["room1"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # Setup room state with very low time remaining
-        room_state = {
-            "game_state": {
-                "phase": "responding",
-                "phase_duration": 180
-            }
-        }
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_game_manager.get_phase_time_remaining.return_value = 8  # Less than 10 seconds
-
-        current_time = time.time()
-        last_broadcast = {}
-
-        self.service._broadcast_countdown_updates(current_time, last_broadcast)
-
-        # Verify countdown update and final warning were sent
-        assert self.mock_broadcast_service.emit_to_room.call_count == 2
-
-        # Check final warning call
-        warning_call = self.mock_broadcast_service.emit_to_room.call_args_list[1]
-        assert warning_call[0][0] == 'time_warning'
-        assert warning_call[0][1] == {
-            'message': '10 seconds remaining!',
-            'time_remaining': 8
-        }
-
-    def test_broadcast_countdown_updates_handles_room_exceptions(self):
-        """Test that countdown updates handle exceptions for individual rooms gracefully"""
-        room_ids = ["room1", "room2"]
-        self.mock_room_manager.get_all_rooms.return_value = room_ids
-
-        # First room throws exception, second works normally
-        room_states = [
-            Exception("Test error"),
-            {"game_state": {"phase": "responding", "phase_duration": 180}}
-        ]
-        self.mock_room_manager.get_room_state.side_effect = room_states
-        self.mock_game_manager.get_phase_time_remaining.return_value = 120
-
-        current_time = time.time()
-        last_broadcast = {}
-
-        # Should not raise exception
-        self.service._broadcast_countdown_updates(current_time, last_broadcast)
-
-        # Second room should still be processed
-        self.mock_broadcast_service.emit_to_room.assert_called_once()
-
     def test_broadcast_guessing_phase_timeout_started_creates_correct_data(self):
         """Test that guessing phase timeout broadcast creates correct data structure"""
         room_id = "test_room"
@@ -483,10 +299,7 @@ class TestAutoGameFlowServicePlayerDisconnectImpact:
         # Create mock configuration
         self.mock_config = Mock()
         self.mock_config.game_flow_check_interval = 1
-        self.mock_config.countdown_broadcast_interval = 10
         self.mock_config.room_status_broadcast_interval = 60
-        self.mock_config.warning_threshold_seconds = 30
-        self.mock_config.final_warning_threshold_seconds = 10
         self.mock_config.room_cleanup_inactive_minutes = 60
         self.mock_config.min_players_required = 2
 
@@ -507,34 +320,23 @@ class TestAutoGameFlowServicePlayerDisconnectImpact:
         room_id = "test_room"
         disconnected_player_id = "player1"
 
-        # Setup room state
-        room_state = {
-            "game_state": {"phase": "responding"}
-        }
-        connected_players = [{"id": "player2"}, {"id": "player3"}]  # 2 players remaining
-
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_room_manager.get_connected_players.return_value = connected_players
+        # Responding phase with 2 players remaining and no responses yet
+        self.mock_room_manager.get_phase_progress.return_value = ("responding", 2, 0, 0)
 
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
 
         # Verify no phase reset occurred
         self.mock_game_manager._advance_to_waiting_phase.assert_not_called()
         self.mock_broadcast_service.broadcast_game_paused.assert_not_called()
+        self.mock_game_manager.advance_game_phase.assert_not_called()
 
     def test_disconnect_with_insufficient_players_resets_to_waiting(self):
         """Test that disconnect with insufficient players resets to waiting phase"""
         room_id = "test_room"
         disconnected_player_id = "player1"
 
-        # Setup room state with active game
-        room_state = {
-            "game_state": {"phase": "responding"}
-        }
-        connected_players = [{"id": "player2"}]  # Only 1 player remaining, need 2
-
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_room_manager.get_connected_players.return_value = connected_players
+        # Active game with only 1 player remaining, need 2
+        self.mock_room_manager.get_phase_progress.return_value = ("responding", 1, 0, 0)
         self.mock_game_manager._advance_to_waiting_phase.return_value = "waiting"
 
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
@@ -560,14 +362,8 @@ class TestAutoGameFlowServicePlayerDisconnectImpact:
         room_id = "test_room"
         disconnected_player_id = "player1"
 
-        # Setup room state already in waiting
-        room_state = {
-            "game_state": {"phase": "waiting"}
-        }
-        connected_players = [{"id": "player2"}]  # Only 1 player
-
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_room_manager.get_connected_players.return_value = connected_players
+        # Room already in waiting with only 1 player
+        self.mock_room_manager.get_phase_progress.return_value = ("waiting", 1, 0, 0)
 
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
 
@@ -580,20 +376,8 @@ class TestAutoGameFlowServicePlayerDisconnectImpact:
         room_id = "test_room"
         disconnected_player_id = "player1"
 
-        # Setup room state with responses from all remaining players
-        room_state = {
-            "game_state": {
-                "phase": "responding",
-                "responses": [
-                    {"author_id": "player2", "text": "response2"},
-                    {"author_id": "player3", "text": "response3"}
-                ]
-            }
-        }
-        connected_players = [{"id": "player2"}, {"id": "player3"}]  # 2 responses, 2 players
-
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_room_manager.get_connected_players.return_value = connected_players
+        # 2 responses from the 2 remaining players
+        self.mock_room_manager.get_phase_progress.return_value = ("responding", 2, 2, 0)
         self.mock_game_manager.advance_game_phase.return_value = "guessing"
 
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
@@ -608,20 +392,8 @@ class TestAutoGameFlowServicePlayerDisconnectImpact:
         room_id = "test_room"
         disconnected_player_id = "player1"
 
-        # Setup room state with guesses from all remaining players
-        room_state = {
-            "game_state": {
-                "phase": "guessing",
-                "guesses": [
-                    {"author_id": "player2", "guess": "guess2"},
-                    {"author_id": "player3", "guess": "guess3"}
-                ]
-            }
-        }
-        connected_players = [{"id": "player2"}, {"id": "player3"}]  # 2 guesses, 2 players
-
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_room_manager.get_connected_players.return_value = connected_players
+        # 2 guesses from the 2 remaining players
+        self.mock_room_manager.get_phase_progress.return_value = ("guessing", 2, 2, 2)
         self.mock_game_manager.advance_game_phase.return_value = "results"
 
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
@@ -636,38 +408,20 @@ class TestAutoGameFlowServicePlayerDisconnectImpact:
         room_id = "nonexistent_room"
         disconnected_player_id = "player1"
 
-        self.mock_room_manager.get_room_state.return_value = None
+        self.mock_room_manager.get_phase_progress.return_value = None
 
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
 
         # Verify no further processing
-        self.mock_room_manager.get_connected_players.assert_not_called()
         self.mock_game_manager._advance_to_waiting_phase.assert_not_called()
-
-    def test_disconnect_handles_player_retrieval_exception(self):
-        """Test that disconnect handling continues when player retrieval fails"""
-        room_id = "test_room"
-        disconnected_player_id = "player1"
-
-        # Setup room state
-        room_state = {
-            "game_state": {"phase": "responding"}
-        }
-
-        self.mock_room_manager.get_room_state.return_value = room_state
-        self.mock_room_manager.get_connected_players.side_effect = Exception("Test error")
-
-        self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
-
-        # Should treat as having 0 players and reset to waiting
-        self.mock_game_manager._advance_to_waiting_phase.assert_called_once_with(room_id)
+        self.mock_game_manager.advance_game_phase.assert_not_called()
 
     def test_disconnect_handles_general_exceptions(self):
         """Test that disconnect handling handles exceptions gracefully"""
         room_id = "test_room"
         disconnected_player_id = "player1"
 
-        self.mock_room_manager.get_room_state.side_effect = Exception("Test error")
+        self.mock_room_manager.get_phase_progress.side_effect = Exception("Test error")
 
         # Should not raise exception
         self.service.handle_player_disconnect_game_impact(room_id, disconnected_player_id)
@@ -690,10 +444,7 @@ class TestAutoGameFlowServiceThreading:
         # Create mock configuration
         self.mock_config = Mock()
         self.mock_config.game_flow_check_interval = 0.1  # Fast for testing
-        self.mock_config.countdown_broadcast_interval = 10
         self.mock_config.room_status_broadcast_interval = 60
-        self.mock_config.warning_threshold_seconds = 30
-        self.mock_config.final_warning_threshold_seconds = 10
         self.mock_config.room_cleanup_inactive_minutes = 60
         self.mock_config.min_players_required = 2
 
@@ -780,7 +531,6 @@ class TestAutoGameFlowServiceThreading:
         with patch('src.services.auto_game_flow_service.get_config', return_value=self.mock_config), \
              patch('src.services.auto_game_flow_service.RoomStatePresenter', return_value=self.mock_room_state_presenter), \
              patch('threading.Thread'), \
-             patch('time.sleep') as mock_sleep, \
              patch('time.time', return_value=1000.0):
 
             service = AutoGameFlowService(
@@ -788,6 +538,7 @@ class TestAutoGameFlowServiceThreading:
                 game_manager=self.mock_game_manager,
                 room_manager=self.mock_room_manager
             )
+            service._stop_event.wait = mock_wait = Mock()
 
             # Set running to False immediately
             service.running = False
@@ -795,16 +546,15 @@ class TestAutoGameFlowServiceThreading:
             # Call timer loop directly
             service._timer_loop()
 
-            # Verify no processing occurred and no sleep was called
-            self.mock_room_manager.get_all_rooms.assert_not_called()
-            mock_sleep.assert_not_called()
+            # Verify no processing occurred and no wait happened
+            self.mock_room_manager.get_expired_room_ids.assert_not_called()
+            mock_wait.assert_not_called()
 
     def test_timer_loop_calls_core_methods_in_sequence(self):
         """Test that timer loop calls core methods in correct sequence"""
         with patch('src.services.auto_game_flow_service.get_config', return_value=self.mock_config), \
              patch('src.services.auto_game_flow_service.RoomStatePresenter', return_value=self.mock_room_state_presenter), \
              patch('threading.Thread'), \
-             patch('time.sleep') as mock_sleep, \
              patch('time.time', return_value=1000.0) as mock_time:
 
             service = AutoGameFlowService(
@@ -812,10 +562,10 @@ class TestAutoGameFlowServiceThreading:
                 game_manager=self.mock_game_manager,
                 room_manager=self.mock_room_manager
             )
+            service._stop_event.wait = mock_wait = Mock()
 
             # Mock core methods
             with patch.object(service, '_check_phase_timeouts') as mock_check_timeouts, \
-                 patch.object(service, '_broadcast_countdown_updates') as mock_broadcast_updates, \
                  patch.object(service, '_cleanup_inactive_rooms') as mock_cleanup:
 
                 # Set up to run only one iteration
@@ -828,78 +578,58 @@ class TestAutoGameFlowServiceThreading:
                     if iteration_count >= 1:
                         service.running = False
 
-                mock_sleep.side_effect = side_effect
+                mock_wait.side_effect = side_effect
 
                 # Call timer loop
                 service._timer_loop()
 
                 # Verify methods were called in correct order
-                mock_check_timeouts.assert_called_once()
-                mock_broadcast_updates.assert_called_once_with(1000.0, {})
-                # Cleanup may or may not be called depending on timing (1000 % 60 != 0)
-                mock_sleep.assert_called_once_with(0.1)
+                mock_check_timeouts.assert_called_once_with()
+                # Cleanup is not due until a full interval after the loop starts
+                mock_cleanup.assert_not_called()
+                mock_wait.assert_called_once_with(0.1)
 
     def test_timer_loop_handles_room_cleanup_timing(self):
-        """Test that timer loop only calls room cleanup at appropriate intervals"""
+        """Test that timer loop calls room cleanup once per interval regardless of tick alignment"""
         with patch('src.services.auto_game_flow_service.get_config', return_value=self.mock_config), \
              patch('src.services.auto_game_flow_service.RoomStatePresenter', return_value=self.mock_room_state_presenter), \
-             patch('threading.Thread'), \
-             patch('time.sleep') as mock_sleep:
+             patch('threading.Thread'):
 
             service = AutoGameFlowService(
                 broadcast_service=self.mock_broadcast_service,
                 game_manager=self.mock_game_manager,
                 room_manager=self.mock_room_manager
             )
+            service._stop_event.wait = mock_wait = Mock()
 
             # Mock core methods
             with patch.object(service, '_check_phase_timeouts'), \
-                 patch.object(service, '_broadcast_countdown_updates'), \
                  patch.object(service, '_cleanup_inactive_rooms') as mock_cleanup:
 
-                # Test with time that doesn't trigger cleanup (not divisible by 60)
-                with patch('time.time', return_value=1001.0):
-                    service.running = True
-                    iteration_count = 0
-
-                    def side_effect(*args):
-                        nonlocal iteration_count
-                        iteration_count += 1
-                        if iteration_count >= 1:
-                            service.running = False
-
-                    mock_sleep.side_effect = side_effect
-                    service._timer_loop()
-
-                    # Cleanup should not be called
-                    mock_cleanup.assert_not_called()
+                # Loop starts at 1000.3; ticks drift past the 60s deadline without
+                # ever landing on a whole multiple of the interval
+                tick_times = [1000.3, 1001.3, 1060.4, 1061.4, 1120.5]
+                cleanup_calls_per_tick = []
 
-                # Reset mock
-                mock_cleanup.reset_mock()
-
-                # Test with time that triggers cleanup (divisible by 60)
-                with patch('time.time', return_value=1020.0):
-                    service.running = True
-                    iteration_count = 0
+                def side_effect(*args):
+                    cleanup_calls_per_tick.append(mock_cleanup.call_count)
+                    if len(cleanup_calls_per_tick) >= len(tick_times) - 1:
+                        service.running = False
 
-                    def side_effect(*args):
-                        nonlocal iteration_count
-                        iteration_count += 1
-                        if iteration_count >= 1:
-                            service.running = False
+                mock_wait.side_effect = side_effect
+                service.running = True
 
-                    mock_sleep.side_effect = side_effect
+                with patch('time.time', side_effect=tick_times):
                     service._timer_loop()
 
-                    # Cleanup should be called
-                    mock_cleanup.assert_called_once()
+                # Cleanup fires once when the deadline passes, then waits a full interval
+                assert cleanup_calls_per_tick == [0, 1, 1, 2]
 
     def test_timer_loop_handles_exceptions_gracefully(self):
         """Test that timer loop handles exceptions and continues running"""
         with patch('src.services.auto_game_flow_service.get_config', return_value=self.mock_config), \
              patch('src.services.auto_game_flow_service.RoomStatePresenter', return_value=self.mock_room_state_presenter), \
              patch('threading.Thread'), \
-             patch('time.sleep') as mock_sleep, \
              patch('time.time', return_value=1000.0):
 
             service = AutoGameFlowService(
@@ -907,10 +637,10 @@ class TestAutoGameFlowServiceThreading:
                 game_manager=self.mock_game_manager,
                 room_manager=self.mock_room_manager
             )
+            service._stop_event.wait = mock_wait = Mock()
 
             # Mock one method to throw exception
             with patch.object(service, '_check_phase_timeouts', side_effect=Exception("Test error")), \
-                 patch.object(service, '_broadcast_countdown_updates'), \
                  patch.object(service, '_cleanup_inactive_rooms'):
 
                 service.running = True
@@ -922,38 +652,32 @@ class TestAutoGameFlowServiceThreading:
                     if iteration_count >= 1:
                         service.running = False
 
-                mock_sleep.side_effect = side_effect
+                mock_wait.side_effect = side_effect
 
                 # Should not raise exception
                 service._timer_loop()
 
-                # Sleep should still be called (for error recovery)
-                mock_sleep.assert_called_once_with(0.1)
+                # Wait should still happen (for error recovery)
+                mock_wait.assert_called_once_with(0.1)
 
-    def test_timer_loop_maintains_last_broadcast_state(self):
-        """Test that timer loop maintains last broadcast state across iterations"""
+    def test_timer_loop_does_not_broadcast_countdowns(self):
+        """Test that timer loop leaves countdowns to the clients and emits nothing per tick"""
         with patch('src.services.auto_game_flow_service.get_config', return_value=self.mock_config), \
              patch('src.services.auto_game_flow_service.RoomStatePresenter', return_value=self.mock_room_state_presenter), \
              patch('threading.Thread'), \
-             patch('time.sleep') as mock_sleep, \
-             patch('time.time', side_effect=[1000.0, 1001.0]) as mock_time:
+             patch('time.time', side_effect=[1000.0, 1000.0, 1001.0]):
 
             service = AutoGameFlowService(
                 broadcast_service=self.mock_broadcast_service,
                 game_manager=self.mock_game_manager,
                 room_manager=self.mock_room_manager
             )
+            service._stop_event.wait = mock_wait = Mock()
 
-            broadcast_updates_calls = []
-
-            def capture_broadcast_call(current_time, last_broadcast):
-                broadcast_updates_calls.append((current_time, last_broadcast.copy()))
-
-            # Mock core methods
-            with patch.object(service, '_check_phase_timeouts'), \
-                 patch.object(service, '_broadcast_countdown_updates', side_effect=capture_broadcast_call), \
-                 patch.object(service, '_cleanup_inactive_rooms'):
+            # No room has reached its deadline yet
+            self.mock_room_manager.get_expired_room_ids.return_value = []
 
+            with patch.object(service, '_cleanup_inactive_rooms'):
                 service.running = True
                 iteration_count = 0
 
@@ -963,27 +687,19 @@ class TestAutoGameFlowServiceThreading:
                     if iteration_count >= 2:
                         service.running = False
 
-                mock_sleep.side_effect = side_effect
+                mock_wait.side_effect = side_effect
 
-                # Call timer loop
                 service._timer_loop()
 
-                # Verify broadcast updates was called with same last_broadcast dict
-                assert len(broadcast_updates_calls) == 2
-                # The last_broadcast dict should be the same object across calls
-                first_call_dict = broadcast_updates_calls[0][1]
-                second_call_dict = broadcast_updates_calls[1][1]
-                # Both should be the same dict object (identity check isn't possible here, but they should have same state)
+                assert self.mock_room_manager.get_expired_room_ids.call_count == 2
+                self.mock_broadcast_service.emit_to_room.assert_not_called()
 
     def test_real_thread_lifecycle_integration(self):
         """Integration test for real thread lifecycle without mocking Thread class"""
         # Use a very fast check interval for testing
         fast_config = Mock()
         fast_config.game_flow_check_interval = 0.01  # 10ms for fast testing
-        fast_config.countdown_broadcast_interval = 10
         fast_config.room_status_broadcast_interval = 60
-        fast_config.warning_threshold_seconds = 30
-        fast_config.final_warning_threshold_seconds = 10
         fast_config.room_cleanup_inactive_minutes = 60
         fast_config.min_players_required = 2
 
@@ -1013,6 +729,33 @@ class TestAutoGameFlowServiceThreading:
             time.sleep(0.02)
             assert not service.timer_thread.is_alive()
 
+    def test_stop_wakes_timer_loop_mid_interval(self):
+        """Test that stop interrupts the wait between checks instead of sitting it out"""
+        slow_config = Mock()
+        slow_config.game_flow_check_interval = 30
+        slow_config.room_status_broadcast_interval = 60
+        slow_config.room_cleanup_inactive_minutes = 60
+        slow_config.min_players_required = 2
+        self.mock_room_manager.get_expired_room_ids.return_value = []
+
+        with patch('src.services.auto_game_flow_service.get_config', return_value=slow_config), \
+             patch('src.services.auto_game_flow_service.RoomStatePresenter', return_value=self.mock_room_state_presenter):
+
+            service = AutoGameFlowService(
+                broadcast_service=self.mock_broadcast_service,
+                game_manager=self.mock_game_manager,
+                room_manager=self.mock_room_manager
+            )
+
+            # Let the loop finish its first check and start waiting
+            time.sleep(0.05)
+
+            start = time.monotonic()
+            service.stop()
+
+            assert not service.timer_thread.is_alive()
+            assert time.monotonic() - start < 1
+
     def test_thread_daemon_property_set_correctly(self):
         """Test that background thread is created as daemon thread"""
         with patch('src.services.auto_game_flow_service.get_config', return_value=self.mock_config), \
@@ -1079,10 +822,7 @@ class TestAutoGameFlowServiceThreading:
         # Create config with specific values
         custom_config = Mock()
         custom_config.game_flow_check_interval = 0.5
-        custom_config.countdown_broadcast_interval = 15
         custom_config.room_status_broadcast_interval = 30
-        custom_config.warning_threshold_seconds = 45
-        custom_config.final_warning_threshold_seconds = 15
         custom_config.room_cleanup_inactive_minutes = 90
         custom_config.min_players_required = 3
 
@@ -1098,9 +838,6 @@ class TestAutoGameFlowServiceThreading:
 
             # Verify configuration values are set correctly
             assert service.check_interval == 0.5
-            assert service.countdown_broadcast_interval == 15
             assert service.room_status_broadcast_interval == 30
-            assert service.warning_threshold_seconds == 45
-            assert service.final_warning_threshold_seconds == 15
             assert service.room_cleanup_inactive_minutes == 90
             assert service.min_players_required == 3
\ No newline at end of file
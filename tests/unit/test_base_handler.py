@@ -388,7 +388,7 @@ class TestBaseHandlerLogging:
             self.handler.log_handler_start("test_handler", test_data)
 
         mock_logger.info.assert_called_once_with('test_handler called by client: test_socket_456')
-        mock_logger.debug.assert_called_once_with("test_handler data: {'test': 'data'}")
+        mock_logger.debug.assert_called_once_with('%s data: %s', 'test_handler', test_data)
 
     def test_log_handler_success(self):
         """Test logging handler success"""
@@ -442,7 +442,7 @@ class TestRoomHandlerMixin:
 
         mock_join_room.assert_called_once_with(room_id)
         mock_logger.debug.assert_called_once_with(
-            'Client test_socket_789 joined Socket.IO room: test_room_123'
+            'Client %s joined Socket.IO room: %s', 'test_socket_789', 'test_room_123'
         )
 
     def test_leave_socketio_room(self):
@@ -457,7 +457,7 @@ class TestRoomHandlerMixin:
 
         mock_leave_room.assert_called_once_with(room_id)
         mock_logger.debug.assert_called_once_with(
-            'Client test_socket_789 left Socket.IO room: test_room_456'
+            'Client %s left Socket.IO room: %s', 'test_socket_789', 'test_room_456'
         )
 
     def test_broadcast_to_room(self):
@@ -473,7 +473,7 @@ class TestRoomHandlerMixin:
 
         mock_emit.assert_called_once_with(event_name, test_data, to=room_id)
         mock_logger.debug.assert_called_once_with(
-            'Broadcasted test_event to room: test_room_broadcast'
+            'Broadcasted %s to room: %s', event_name, room_id
         )
 
 
@@ -7,6 +7,7 @@ import pytest
 from unittest.mock import Mock, MagicMock, patch
 from datetime import datetime
 
+from src.room_manager import RoomManager
 from src.services.broadcast_service import BroadcastService
 from tests.helpers.socket_mocks import create_broadcast_service_mocks
 
@@ -184,6 +185,123 @@ class TestBroadcastService:
         # Should not raise exception
         self.broadcast_service.broadcast_player_list_update("room123")
 
+    def test_broadcast_room_state_update_reuses_payload_until_version_changes(self):
+        """Test room state payloads are rebuilt only when the room version changes"""
+        room_id = "room123"
+        room_state = {'players': {}, 'game_state': {'phase': 'responding'}, 'version': 3}
+        self.mock_room_manager.get_room_state.return_value = room_state
+        self.mock_room_state_presenter.create_safe_game_state.return_value = {
+            'phase': 'responding',
+            'response_count': 1,
+            'time_remaining': 120
+        }
+        self.mock_game_manager.get_phase_time_remaining.return_value = 119
+
+        self.broadcast_service.broadcast_room_state_update(room_id)
+        self.broadcast_service.broadcast_room_state_update(room_id)
+
+        # Second broadcast reuses the payload but reports the current time remaining
+        self.mock_room_state_presenter.create_safe_game_state.assert_called_once_with(room_state, room_id)
+        assert self.mock_socketio.emit.call_args_list[1][0][1] == {
+            'phase': 'responding',
+            'response_count': 1,
+            'time_remaining': 119
+        }
+
+        # A state change bumps the version and forces a rebuild
+        room_state['version'] = 4
+        self.broadcast_service.broadcast_room_state_update(room_id)
+        assert self.mock_room_state_presenter.create_safe_game_state.call_count == 2
+
+    def test_broadcast_player_list_update_reuses_payload_for_same_version(self):
+        """Test player list payloads are cached per room version"""
+        room_state = {'players': {}, 'game_state': {'phase': 'waiting'}, 'version': 1}
+        self.mock_room_manager.get_room_state.return_value = room_state
+        self.mock_room_state_presenter.create_player_list_update.return_value = {
+            'players': [], 'connected_count': 0, 'total_count': 0
+        }
+
+        self.broadcast_service.broadcast_player_list_update("room1")
+        self.broadcast_service.broadcast_player_list_update("room1")
+        self.broadcast_service.broadcast_player_list_update("room2")
+
+        # One build per room; the repeat for room1 skips the connected player lookup too
+        assert self.mock_room_state_presenter.create_player_list_update.call_count == 2
+        assert self.mock_room_manager.get_connected_players_readonly.call_count == 2
+        # The repeat for room1 is not re-sent either
+        assert self.mock_socketio.emit.call_count == 2
+
+    def test_broadcast_player_list_update_skips_unchanged_list(self):
+        """Test an identical player list is not re-sent after an unrelated state change"""
+        room_state = {'players': {}, 'game_state': {'phase': 'waiting'}, 'version': 1}
+        self.mock_room_manager.get_room_state.return_value = room_state
+        self.mock_room_state_presenter.create_player_list_update.side_effect = [
+            {'players': [{'name': 'a', 'score': 0}], 'connected_count': 1, 'total_count': 1},
+            {'players': [{'name': 'a', 'score': 0}], 'connected_count': 1, 'total_count': 1},
+            {'players': [{'name': 'a', 'score': 1}], 'connected_count': 1, 'total_count': 1}
+        ]
+
+        self.broadcast_service.broadcast_player_list_update("room1")
+        room_state['version'] = 2
+        self.broadcast_service.broadcast_player_list_update("room1")
+        room_state['version'] = 3
+        self.broadcast_service.broadcast_player_list_update("room1")
+
+        assert self.mock_socketio.emit.call_count == 2
+        assert self.mock_socketio.emit.call_args[0][1]['players'][0]['score'] == 1
+
+    def test_cached_payloads_not_reused_for_recreated_room(self):
+        """Test a room recreated under a deleted room's ID gets freshly built payloads"""
+        room_manager = RoomManager()
+        self.broadcast_service.room_manager = room_manager
+        self.mock_room_state_presenter.create_room_state_for_player.side_effect = (
+            lambda room_state, room_id, connected: {
+                'players': [p['name'] for p in room_state['players'].values()],
+                'game_state': {}
+            })
+
+        alice = room_manager.add_player_to_room("party", "Alice", "socket1")
+        self.broadcast_service.send_room_state_to_player("party", "socket1")
+        room_manager.remove_player_from_room("party", alice['player_id'])
+        assert not room_manager.room_exists("party")
+
+        room_manager.add_player_to_room("party", "Bob", "socket2")
+        self.broadcast_service.send_room_state_to_player("party", "socket2")
+
+        assert self.mock_socketio.emit.call_args[0][1]['players'] == ['Bob']
+
+    def test_broadcast_player_list_update_force_sends_repeat(self):
+        """Test a forced player list update is sent even if unchanged"""
+        room_state = {'players': {}, 'game_state': {'phase': 'waiting'}, 'version': 1}
+        self.mock_room_manager.get_room_state.return_value = room_state
+        self.mock_room_state_presenter.create_player_list_update.return_value = {
+            'players': [], 'connected_count': 0, 'total_count': 0
+        }
+
+        self.broadcast_service.broadcast_player_list_update("room1")
+        self.broadcast_service.broadcast_player_list_update("room1", force=True)
+
+        assert self.mock_socketio.emit.call_count == 2
+
+    def test_broadcast_player_list_update_not_skipped_for_recreated_room(self):
+        """Test a recreated room's first player list is not compared with the deleted room's"""
+        room_manager = RoomManager()
+        self.broadcast_service.room_manager = room_manager
+        self.mock_room_state_presenter.create_player_list_update.side_effect = (
+            lambda room_state, connected: {
+                'players': [p['name'] for p in room_state['players'].values()]
+            })
+
+        alice = room_manager.add_player_to_room("party", "Alice", "socket1")
+        self.broadcast_service.broadcast_player_list_update("party")
+        room_manager.remove_player_from_room("party", alice['player_id'])
+        assert not room_manager.room_exists("party")
+
+        room_manager.add_player_to_room("party", "Alice", "socket2")
+        self.broadcast_service.broadcast_player_list_update("party")
+
+        assert self.mock_socketio.emit.call_count == 2
+
     def test_broadcast_room_state_update_waiting_phase(self):
         """Test room state broadcast in waiting phase"""
         room_id = "room123"
@@ -397,6 +515,74 @@ class TestBroadcastService:
 
         assert payload['phase_start_time'] is None
 
+    def test_broadcast_response_submitted_uses_phase_progress(self):
+        """Test response submission counts come from the room's phase progress"""
+        self.mock_room_manager.get_phase_progress.return_value = ('responding', 3, 2, 0)
+        self.mock_game_manager.get_phase_time_remaining.return_value = 90
+
+        self.broadcast_service.broadcast_response_submitted('room123')
+
+        self.mock_room_manager.get_room_state.assert_not_called()
+        self.mock_socketio.emit.assert_called_once_with('response_submitted', {
+            'response_count': 2,
+            'total_players': 3,
+            'time_remaining': 90
+        }, room='room123')
+
+    def test_broadcast_guess_submitted_uses_phase_progress(self):
+        """Test guess submission counts come from the room's phase progress"""
+        self.mock_room_manager.get_phase_progress.return_value = ('guessing', 4, 4, 1)
+        self.mock_game_manager.get_phase_time_remaining.return_value = 30
+
+        self.broadcast_service.broadcast_guess_submitted('room123')
+
+        self.mock_socketio.emit.assert_called_once_with('guess_submitted', {
+            'guess_count': 1,
+            'total_players': 4,
+            'time_remaining': 30
+        }, room='room123')
+
+    def test_broadcast_response_submitted_no_room(self):
+        """Test response submission broadcast is skipped for a missing room"""
+        self.mock_room_manager.get_phase_progress.return_value = None
+
+        self.broadcast_service.broadcast_response_submitted('room123')
+
+        self.mock_socketio.emit.assert_not_called()
+
+    def test_broadcast_guessing_phase_started_builds_shared_payload_once(self):
+        """Test each connected player gets the shared payload minus their own response"""
+        room_state = {
+            'players': {
+                'p1': {'connected': True, 'socket_id': 's1'},
+                'p2': {'connected': True, 'socket_id': 's2'},
+                'p3': {'connected': False, 'socket_id': 's3'}
+            },
+            'game_state': {
+                'responses': [
+                    {'author_id': 'p1', 'text': 'one'},
+                    {'author_id': 'p2', 'text': 'two'}
+                ]
+            }
+        }
+        self.mock_room_manager.get_room_state.return_value = room_state
+        self.mock_room_state_presenter.create_guessing_phase_data.return_value = {
+            'phase': 'guessing',
+            'responses': [{'index': 0, 'text': 'one'}, {'index': 1, 'text': 'two'}],
+            'round_number': 1,
+            'phase_duration': 120,
+            'time_remaining': 120
+        }
+
+        self.broadcast_service.broadcast_guessing_phase_started('room123')
+
+        self.mock_room_state_presenter.create_guessing_phase_data.assert_called_once_with(room_state, 'room123')
+        assert self.mock_socketio.emit.call_count == 2
+        sent = {call[1]['room']: call[0][1] for call in self.mock_socketio.emit.call_args_list}
+        assert sent['s1']['responses'] == [{'index': 1, 'text': 'two'}]
+        assert sent['s2']['responses'] == [{'index': 0, 'text': 'one'}]
+        assert sent['s1']['round_number'] == 1
+
 
 class TestBroadcastServiceEdgeCases:
     """Test edge cases and error scenarios"""
@@ -23,7 +23,6 @@ class TestConcurrencyControlServiceInitialization:
         service = ConcurrencyControlService()
 
         assert isinstance(service._room_locks, dict)
-        assert isinstance(service._locks_lock, threading.Lock)
         assert isinstance(service._recent_requests, dict)
         assert hasattr(service, 'game_settings')
         assert hasattr(service, '_request_window')
@@ -69,7 +68,7 @@ class TestRoomLockingMechanisms:
         # First call should create the lock
         lock = self.service.get_room_lock(room_id)
 
-        assert isinstance(lock, type(threading.RLock()))
+        assert isinstance(lock, type(threading.Lock()))
         assert room_id in self.service._room_locks
         assert self.service._room_locks[room_id] is lock
 
@@ -250,6 +249,21 @@ class TestRequestDeduplication:
         finally:
             self.service._request_window = original_window
 
+    def test_check_duplicate_request_cleanup_stops_at_first_live_request(self):
+        """Test cleanup drops only the expired requests at the front of the queue"""
+        self.service._request_window = 10
+        with patch('src.services.concurrency_control_service.time.time') as mock_time:
+            mock_time.return_value = 100.0
+            self.service.check_duplicate_request("old_request")
+            mock_time.return_value = 105.0
+            self.service.check_duplicate_request("live_request")
+
+            mock_time.return_value = 112.0
+            assert not self.service.check_duplicate_request("new_request")
+
+        assert "old_request" not in self.service._recent_requests
+        assert [key for _, key in self.service._request_queue] == ["live_request", "new_request"]
+
     def test_check_duplicate_request_multiple_users(self):
         """Test deduplication works independently for different users"""
         request_key1 = "user_1_action_submit"
@@ -555,7 +569,7 @@ class TestRaceConditionPrevention:
 
         # No exceptions should occur
         for result in access_results:
-            assert isinstance(result, type(threading.RLock()))
+            assert isinstance(result, type(threading.Lock()))
 
         for result in cleanup_results:
             assert result == "success"
@@ -637,14 +651,14 @@ class TestEdgeCasesAndErrorHandling:
 
         # Should not raise exception
         lock = self.service.get_room_lock(empty_room_id)
-        assert isinstance(lock, type(threading.RLock()))
+        assert isinstance(lock, type(threading.Lock()))
         assert empty_room_id in self.service._room_locks
 
     def test_none_room_id_handling(self):
         """Test handling of None room ID"""
         # Should handle None gracefully
         lock = self.service.get_room_lock(None)
-        assert isinstance(lock, type(threading.RLock()))
+        assert isinstance(lock, type(threading.Lock()))
         assert None in self.service._room_locks
 
     def test_special_characters_in_room_id(self):
@@ -125,9 +125,8 @@ class TestAppConfig:
     def test_config_validation_game_flow_intervals(self):
         """Test validation for auto game flow timing settings"""
         # Valid values
-        config = AppConfig(game_flow_check_interval=2, countdown_broadcast_interval=15)
+        config = AppConfig(game_flow_check_interval=2)
         assert config.game_flow_check_interval == 2
-        assert config.countdown_broadcast_interval == 15
         
         # Invalid: check interval too small
         with pytest.raises(ConfigError, match="Invalid game_flow_check_interval"):
@@ -136,25 +135,6 @@ class TestAppConfig:
         # Invalid: check interval too large
         with pytest.raises(ConfigError, match="Invalid game_flow_check_interval"):
             AppConfig(game_flow_check_interval=120)
-        
-        # Invalid: broadcast interval too small
-        with pytest.raises(ConfigError, match="Invalid countdown_broadcast_interval"):
-            AppConfig(countdown_broadcast_interval=0)
-    
-    def test_config_validation_warning_thresholds(self):
-        """Test validation for warning threshold settings"""
-        # Valid values
-        config = AppConfig(warning_threshold_seconds=45, final_warning_threshold_seconds=15)
-        assert config.warning_threshold_seconds == 45
-        assert config.final_warning_threshold_seconds == 15
-        
-        # Invalid: final warning >= warning threshold
-        with pytest.raises(ConfigError, match="Invalid final_warning_threshold_seconds"):
-            AppConfig(warning_threshold_seconds=30, final_warning_threshold_seconds=30)
-        
-        # Invalid: final warning > warning threshold
-        with pytest.raises(ConfigError, match="Invalid final_warning_threshold_seconds"):
-            AppConfig(warning_threshold_seconds=10, final_warning_threshold_seconds=15)
     
     def test_config_validation_rate_limiting(self):
         """Test validation for rate limiting settings"""
@@ -254,9 +234,6 @@ class TestConfigurationFactory:
             'FLASK_ENV': 'development',
             'MIN_PLAYERS_REQUIRED': '3',
             'GAME_FLOW_CHECK_INTERVAL': '2',
-            'COUNTDOWN_BROADCAST_INTERVAL': '15',
-            'WARNING_THRESHOLD_SECONDS': '45',
-            'FINAL_WARNING_THRESHOLD_SECONDS': '15',
             'MAX_EVENTS_PER_SECOND': '20',
             'MAX_EVENTS_PER_MINUTE': '200',
             'COMPRESSION_THRESHOLD_BYTES': '1024'
@@ -267,9 +244,6 @@ class TestConfigurationFactory:
         
         assert config.min_players_required == 3
         assert config.game_flow_check_interval == 2
-        assert config.countdown_broadcast_interval == 15
-        assert config.warning_threshold_seconds == 45
-        assert config.final_warning_threshold_seconds == 15
         assert config.max_events_per_second == 20
         assert config.max_events_per_minute == 200
         assert config.compression_threshold_bytes == 1024
@@ -361,9 +361,10 @@ class TestContentManager:
             assert len(prompts) == 2
             assert all(isinstance(p, PromptData) for p in prompts)
             
-            # Verify it returns a copy (not the original list)
-            prompts.append(PromptData('new', 'new', 'new', ['new']))
-            assert len(manager.get_all_prompts()) == 2
+            # Verify it returns a shared immutable view (not the original list)
+            assert isinstance(prompts, tuple)
+            assert manager.get_all_prompts() is prompts
+            assert prompts is not manager.prompts
             
         finally:
             os.unlink(temp_file)
@@ -197,6 +197,32 @@ class TestGameManager:
         game_state = self.game_manager.get_game_state(self.room_id)
         assert game_state["phase"] == GamePhase.RESULTS.value
     
+    def test_repeated_results_advance_is_rejected(self):
+        """Test a second advance into results neither changes phase nor re-applies scores."""
+        self.game_manager.start_new_round(self.room_id, self.prompt_data)
+        self.game_manager.submit_player_response(
+            self.room_id, self.player1["player_id"], "Response 1"
+        )
+        self.game_manager.submit_player_response(
+            self.room_id, self.player2["player_id"], "Response 2"
+        )
+        responses = self.game_manager.get_game_state(self.room_id)["responses"]
+        llm_index = next(i for i, response in enumerate(responses) if response["is_llm"])
+        self.game_manager.submit_player_guess(self.room_id, self.player1["player_id"], llm_index)
+        self.game_manager.advance_game_phase(self.room_id)  # to results
+        
+        results_state = self.game_manager.get_game_state(self.room_id)
+        scores = {p["player_id"]: p["score"] for p in self.room_manager.get_room_players(self.room_id)}
+        assert results_state["phase"] == GamePhase.RESULTS.value
+        assert scores[self.player1["player_id"]] > 0
+        
+        # e.g. the phase timer firing just after the last guess moved the room on
+        self.game_manager._advance_to_results_phase(self.room_id)
+        
+        game_state = self.game_manager.get_game_state(self.room_id)
+        assert game_state["phase_start_time"] == results_state["phase_start_time"]
+        assert {p["player_id"]: p["score"] for p in self.room_manager.get_room_players(self.room_id)} == scores
+    
     def test_manual_phase_advancement(self):
         """Test manual phase advancement (for timeouts)."""
         # Start in responding phase
@@ -0,0 +1,71 @@
+"""
+Game Settings Unit Tests
+
+Tests configuration-backed game settings and testing-mode detection.
+"""
+
+import os
+from unittest.mock import Mock, patch
+
+from src.config.environment import is_testing
+from src.config.game_settings import GameSettings
+
+
+class TestRequestDedupWindow:
+    """Test the request deduplication window setting"""
+
+    def test_testing_mode_uses_short_window(self):
+        """Test the short window is used while running under tests"""
+        settings = GameSettings(app_config=Mock(request_dedup_window_seconds=1.5))
+
+        assert settings.request_dedup_window == 0.01
+
+    def test_configured_window_outside_testing_mode(self):
+        """Test the configured window is used outside testing mode"""
+        settings = GameSettings(app_config=Mock(request_dedup_window_seconds=1.5))
+
+        with patch('src.config.game_settings.is_testing', return_value=False):
+            assert settings.request_dedup_window == 1.5
+
+    def test_fallback_window_without_config(self):
+        """Test the default window is used when no config is available"""
+        settings = GameSettings(app_config=Mock())
+        settings._config = None
+
+        with patch('src.config.game_settings.is_testing', return_value=False):
+            assert settings.request_dedup_window == 1.0
+
+
+class TestIsTesting:
+    """Test the cached testing-mode check"""
+
+    def teardown_method(self):
+        """Drop any result cached under a patched environment"""
+        is_testing.cache_clear()
+
+    def test_detects_pytest(self):
+        """Test testing mode is detected under pytest"""
+        is_testing.cache_clear()
+
+        assert is_testing() is True
+
+    def test_result_is_cached_until_cleared(self):
+        """Test the environment is only re-read after cache_clear"""
+        is_testing.cache_clear()
+        is_testing()
+
+        with patch('src.config.environment.os.environ.get') as mock_get:
+            assert is_testing() is True
+            mock_get.assert_not_called()
+
+            is_testing.cache_clear()
+            is_testing()
+            mock_get.assert_called()
+
+    @patch('sys.argv', [])
+    def test_testing_env_var_detected_without_argv(self):
+        """Test TESTING is honoured even when sys.argv is empty"""
+        with patch.dict(os.environ, {'TESTING': '1'}):
+            is_testing.cache_clear()
+
+            assert is_testing() is True
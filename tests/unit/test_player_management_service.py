@@ -380,7 +380,7 @@ class TestPlayerManagementServiceBasicOperations:
 
         self.mock_room_lifecycle_service.get_room_data.return_value = room
 
-        with patch.object(self.service, 'is_room_empty', return_value=False), \
+        with patch.object(self.service, '_is_room_empty_for', return_value=False), \
              patch.object(self.service, '_remove_player_from_room_state') as mock_remove:
 
             result = self.service.remove_player_from_room(room_id, player_id)
@@ -401,7 +401,7 @@ class TestPlayerManagementServiceBasicOperations:
 
         self.mock_room_lifecycle_service.get_room_data.return_value = room
 
-        with patch.object(self.service, 'is_room_empty', return_value=True), \
+        with patch.object(self.service, '_is_room_empty_for', return_value=True), \
              patch.object(self.service, '_remove_player_from_room_state') as mock_remove:
 
             result = self.service.remove_player_from_room(room_id, player_id)
@@ -480,6 +480,31 @@ class TestPlayerManagementServiceBasicOperations:
         result = self.service.get_connected_players("nonexistent_room")
         assert result == []
 
+    def test_get_phase_progress_counts_connected_players_and_submissions(self):
+        """Test that phase progress reports the phase, connected players and submissions"""
+        room = {
+            "players": {
+                "player1": {"name": "Player1", "connected": True},
+                "player2": {"name": "Player2", "connected": False},
+                "player3": {"name": "Player3", "connected": True}
+            },
+            "game_state": {
+                "phase": "guessing",
+                "responses": [{"author_id": "player1"}, {"author_id": "player3"}],
+                "guesses": {"player1": 0}
+            },
+            "connected_count": 2
+        }
+        self.mock_room_lifecycle_service.get_room_data.return_value = room
+
+        assert self.service.get_phase_progress("test_room") == ("guessing", 2, 2, 1)
+
+    def test_get_phase_progress_handles_nonexistent_room(self):
+        """Test that phase progress is None for a non-existent room"""
+        self.mock_room_lifecycle_service.get_room_data.return_value = None
+
+        assert self.service.get_phase_progress("nonexistent_room") is None
+
     def test_is_room_empty_returns_true_for_no_connected_players(self):
         """Test that room emptiness check returns True for no connected players"""
         room = {
@@ -593,7 +618,7 @@ class TestPlayerManagementServiceBasicOperations:
         self.mock_concurrency_control_service.reset_mock()
 
         # Test remove_player_from_room
-        with patch.object(self.service, 'is_room_empty', return_value=False):
+        with patch.object(self.service, '_is_room_empty_for', return_value=False):
             self.service.remove_player_from_room(room_id, "player1")
             self.mock_concurrency_control_service.room_operation.assert_called_with(room_id)
 
@@ -946,7 +971,7 @@ class TestPlayerManagementServiceAdvancedScenarios:
         self.mock_room_lifecycle_service.get_room_data.return_value = disconnected_only_room
 
         # Remove last disconnected player should trigger room deletion
-        with patch.object(self.service, 'is_room_empty', return_value=True):
+        with patch.object(self.service, '_is_room_empty_for', return_value=True):
             result = self.service.remove_player_from_room(room_id, "disc1")
             assert result is True
             self.mock_room_lifecycle_service.delete_room.assert_called_once_with(room_id)
@@ -965,7 +990,7 @@ class TestPlayerManagementServiceAdvancedScenarios:
         self.mock_room_lifecycle_service.get_room_data.return_value = mixed_room
 
         # Remove disconnected player should not trigger room deletion
-        with patch.object(self.service, 'is_room_empty', return_value=False):
+        with patch.object(self.service, '_is_room_empty_for', return_value=False):
             result = self.service.remove_player_from_room(room_id, "disc1")
             assert result is True
             self.mock_room_lifecycle_service.delete_room.assert_not_called()
@@ -1075,7 +1100,7 @@ class TestPlayerManagementServiceAdvancedScenarios:
         assert player1_data["connected"] is False
 
         # Phase 4: Remove second player (should check if room becomes empty)
-        with patch.object(self.service, 'is_room_empty', return_value=False):  # First player still there, just disconnected
+        with patch.object(self.service, '_is_room_empty_for', return_value=False):  # First player still there, just disconnected
             remove_result = self.service.remove_player_from_room(room_id, "player2")
             assert remove_result is True
             # Room should not be deleted (disconnected player still there)
@@ -1085,7 +1110,7 @@ class TestPlayerManagementServiceAdvancedScenarios:
         room_with_player1_only = {"players": {"player1": player1_data}}
         self.mock_room_lifecycle_service.get_room_data.return_value = room_with_player1_only
 
-        with patch.object(self.service, 'is_room_empty', return_value=True):
+        with patch.object(self.service, '_is_room_empty_for', return_value=True):
             final_remove_result = self.service.remove_player_from_room(room_id, "player1")
             assert final_remove_result is True
             # Room should be deleted (no connected players)
@@ -85,6 +85,11 @@ class TestEventQueueManager:
         event_manager = EventQueueManager()
         assert event_manager._is_testing() == True
 
+    def test_is_testing_uses_shared_check(self):
+        """Test the rate limiter defers to the shared testing-mode check"""
+        with patch('src.services.rate_limit_service.is_testing', return_value=False):
+            assert self.event_manager._is_testing() == False
+
     def test_client_blocking_basic(self):
         """Test basic client blocking functionality"""
         client_id = "test_client_123"
@@ -13,6 +13,13 @@ import time
 from src.services.room_lifecycle_service import RoomLifecycleService
 
 
+def create_room_at(service, room_id, when):
+    """Create a room as if it had been created (and last active) at ``when``."""
+    with patch('src.services.room_lifecycle_service.datetime') as mock_datetime:
+        mock_datetime.now.return_value = when
+        return service.create_room(room_id)
+
+
 class TestRoomLifecycleServiceBasicOperations:
     """Test basic room lifecycle operations"""
 
@@ -267,14 +274,11 @@ class TestRoomLifecycleServiceCleanup:
     def test_cleanup_inactive_rooms_some_inactive(self):
         """Test cleanup with mix of active and inactive rooms"""
         # Create rooms
-        room_ids = ["active_room1", "inactive_room1", "active_room2", "inactive_room2"]
-        for room_id in room_ids:
-            self.service.create_room(room_id)
-
-        # Manually set some rooms as inactive by modifying last_activity
         old_time = datetime.now() - timedelta(minutes=90)
-        self.service._rooms["inactive_room1"]["last_activity"] = old_time
-        self.service._rooms["inactive_room2"]["last_activity"] = old_time
+        self.service.create_room("active_room1")
+        create_room_at(self.service, "inactive_room1", old_time)
+        self.service.create_room("active_room2")
+        create_room_at(self.service, "inactive_room2", old_time)
 
         result = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
 
@@ -290,11 +294,9 @@ class TestRoomLifecycleServiceCleanup:
         """Test cleanup with custom timeout"""
         # Create room
         room_id = "test-room"
-        self.service.create_room(room_id)
 
-        # Set room as inactive for 30 minutes
-        old_time = datetime.now() - timedelta(minutes=30)
-        self.service._rooms[room_id]["last_activity"] = old_time
+        # Room has been inactive for 30 minutes
+        create_room_at(self.service, room_id, datetime.now() - timedelta(minutes=30))
 
         # Cleanup with 60-minute timeout (should not clean)
         result1 = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
@@ -309,11 +311,9 @@ class TestRoomLifecycleServiceCleanup:
     def test_cleanup_inactive_rooms_boundary_condition(self):
         """Test cleanup at exact timeout boundary"""
         room_id = "boundary-room"
-        self.service.create_room(room_id)
 
-        # Set room as inactive for exactly 60 minutes
-        boundary_time = datetime.now() - timedelta(minutes=60)
-        self.service._rooms[room_id]["last_activity"] = boundary_time
+        # Room has been inactive for exactly 60 minutes
+        create_room_at(self.service, room_id, datetime.now() - timedelta(minutes=60))
 
         result = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
 
@@ -321,6 +321,46 @@ class TestRoomLifecycleServiceCleanup:
         assert result == 1
         assert not self.service.room_exists(room_id)
 
+    def test_cleanup_inactive_rooms_reschedules_recently_active_room(self):
+        """Test that a room created long ago but active since is kept, then cleaned once idle"""
+        room_id = "busy-room"
+        create_room_at(self.service, room_id, datetime.now() - timedelta(minutes=90))
+
+        # The room has seen activity since it was created
+        self.service.get_room_data(room_id)["last_activity"] = datetime.now()
+
+        result = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
+
+        assert result == 0
+        assert self.service.room_exists(room_id)
+
+        # Once it goes idle past the timeout it is still picked up
+        later = datetime.now() + timedelta(minutes=90)
+        with patch('src.services.room_lifecycle_service.datetime') as mock_datetime:
+            mock_datetime.now.return_value = later
+            result = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
+
+        assert result == 1
+        assert not self.service.room_exists(room_id)
+
+    def test_cleanup_inactive_rooms_skips_deleted_rooms(self):
+        """Test that stale rooms deleted before cleanup are not counted"""
+        room_id = "deleted-room"
+        create_room_at(self.service, room_id, datetime.now() - timedelta(minutes=90))
+        self.service.delete_room(room_id)
+
+        result = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
+
+        assert result == 0
+
+        # A fresh room under the same ID is unaffected by the old incarnation
+        self.service.create_room(room_id)
+
+        result = self.service.cleanup_inactive_rooms(max_inactive_minutes=60)
+
+        assert result == 0
+        assert self.service.room_exists(room_id)
+
 
 class TestRoomLifecycleServiceResourceManagement:
     """Test resource management and memory cleanup"""
@@ -484,11 +524,9 @@ class TestRoomLifecycleServiceLogging:
     def test_cleanup_rooms_logging(self, mock_logger):
         """Test that cleanup operations are logged"""
         room_id = "cleanup-room"
-        self.service.create_room(room_id)
 
         # Make room inactive
-        old_time = datetime.now() - timedelta(minutes=90)
-        self.service._rooms[room_id]["last_activity"] = old_time
+        create_room_at(self.service, room_id, datetime.now() - timedelta(minutes=90))
 
         mock_logger.reset_mock()  # Clear creation log
 
@@ -8,6 +8,7 @@ Thread safety and concurrency scenarios are covered in test_room_manager_concurr
 
 import pytest
 from datetime import datetime, timedelta
+from unittest.mock import patch
 
 from src.room_manager import RoomManager
 
@@ -126,6 +127,35 @@ class TestRoomManagerStateManagement:
         assert self.room_manager.get_room_state("") is None
         assert self.room_manager.get_room_state("   ") is None
 
+    def test_room_version_increments_on_mutation(self):
+        """Test room version changes on player and game state mutations only."""
+        room_id = "test_room"
+        self.room_manager.create_room(room_id)
+        created_version = self.room_manager.get_room_state(room_id)["version"]
+
+        player = self.room_manager.add_player_to_room(room_id, "Alice", "socket1")
+        joined_version = self.room_manager.get_room_state(room_id)["version"]
+        assert joined_version > created_version
+
+        self.room_manager.update_room_activity(room_id)
+        assert self.room_manager.get_room_state(room_id)["version"] == joined_version
+
+        self.room_manager.update_player_score(room_id, player["player_id"], 3)
+        scored_version = self.room_manager.get_room_state(room_id)["version"]
+        self.room_manager.disconnect_player_from_room(room_id, player["player_id"])
+        assert joined_version < scored_version < self.room_manager.get_room_state(room_id)["version"]
+
+    def test_room_version_not_reused_after_room_id_is_recreated(self):
+        """Test a recreated room never repeats a version of the deleted room."""
+        room_id = "test_room"
+        self.room_manager.create_room(room_id)
+        self.room_manager.add_player_to_room(room_id, "Alice", "socket1")
+        old_version = self.room_manager.get_room_state(room_id)["version"]
+        self.room_manager.delete_room(room_id)
+
+        self.room_manager.create_room(room_id)
+        assert self.room_manager.get_room_state(room_id)["version"] > old_version
+
     def test_update_room_activity(self):
         """Test updating room activity timestamp."""
         room_id = "test_room"
@@ -170,6 +200,27 @@ class TestRoomManagerStateManagement:
         # Room should be deleted when last player is removed
         assert not self.room_manager.room_exists(room_id)
 
+    def test_connected_count_tracks_player_lifecycle(self):
+        """Test the connected player counter follows join, disconnect, reconnect and removal."""
+        room_id = "counter_room"
+
+        alice = self.room_manager.add_player_to_room(room_id, "Alice", "socket1")
+        bob = self.room_manager.add_player_to_room(room_id, "Bob", "socket2")
+        assert self.room_manager._rooms[room_id]["connected_count"] == 2
+
+        # Disconnecting twice only decrements once
+        self.room_manager.disconnect_player_from_room(room_id, alice["player_id"])
+        self.room_manager.disconnect_player_from_room(room_id, alice["player_id"])
+        assert self.room_manager._rooms[room_id]["connected_count"] == 1
+
+        # Reconnection restores the count
+        self.room_manager.add_player_to_room(room_id, "Alice", "socket3")
+        assert self.room_manager._rooms[room_id]["connected_count"] == 2
+
+        self.room_manager.remove_player_from_room(room_id, bob["player_id"])
+        assert self.room_manager._rooms[room_id]["connected_count"] == 1
+        assert not self.room_manager.is_room_empty(room_id)
+
 
 class TestRoomManagerPlayerOperations:
     """Test cases for player operations within rooms."""
@@ -237,6 +288,34 @@ class TestRoomManagerPlayerOperations:
                 # Expected for invalid inputs
                 pass
 
+    def test_invalid_room_id_rejected_before_locking(self):
+        """Test malformed room IDs are rejected without touching room locks."""
+        for room_id in ["", "bad room", "x" * 51, None]:
+            with pytest.raises(ValueError):
+                self.room_manager.add_player_to_room(room_id, "Player1", "socket1")
+            assert self.room_manager.update_room_activity(room_id) is False
+            assert self.room_manager.remove_player_from_room(room_id, "player") is False
+            assert self.room_manager.apply_batch(room_id, []) is None
+
+        assert len(self.room_manager.concurrency_control._room_locks) == 0
+
+    def test_invalid_room_id_rejected_by_read_operations(self):
+        """Test every room_id entry point treats malformed IDs as missing rooms."""
+        for room_id in ["", "bad room", "room\n", "x" * 51, None]:
+            assert self.room_manager.room_exists(room_id) is False
+            assert self.room_manager.delete_room(room_id) is False
+            assert self.room_manager.get_room_state(room_id) is None
+            assert self.room_manager.get_room_players(room_id) == []
+            assert self.room_manager.get_connected_players(room_id) == []
+            assert self.room_manager.get_connected_players_readonly(room_id) == []
+            assert self.room_manager.get_phase_progress(room_id) is None
+            assert self.room_manager.is_room_empty(room_id) is True
+
+        with pytest.raises(ValueError):
+            self.room_manager.create_room("room\n")
+
+        assert len(self.room_manager.concurrency_control._room_locks) == 0
+
     def test_remove_player_from_room_success(self):
         """Test successful player removal."""
         room_id = "removal_test_room"
@@ -364,6 +443,26 @@ class TestRoomManagerPlayerQueries:
         all_players = self.room_manager.get_room_players(room_id)
         assert len(all_players) == 3
 
+    def test_readonly_player_views(self):
+        """Test read-only player views are live and reject mutation."""
+        room_id = "readonly_players_room"
+
+        player1 = self.room_manager.add_player_to_room(room_id, "Player1", "socket1")
+        self.room_manager.add_player_to_room(room_id, "Player2", "socket2")
+        self.room_manager.disconnect_player_from_room(room_id, player1["player_id"])
+
+        connected_views = self.room_manager.get_connected_players_readonly(room_id)
+        assert [view["name"] for view in connected_views] == ["Player2"]
+
+        with pytest.raises(TypeError):
+            connected_views[0]["score"] = 100
+
+        # Views are not snapshots
+        self.room_manager.update_player_score(room_id, connected_views[0]["player_id"], 7)
+        assert connected_views[0]["score"] == 7
+
+        assert self.room_manager.get_connected_players_readonly("nonexistent") == []
+
     def test_find_player_by_id_in_players_list(self):
         """Test finding specific player by ID within the players list."""
         room_id = "player_lookup_room"
@@ -453,6 +552,30 @@ class TestRoomManagerGameOperations:
         result = self.room_manager.update_player_score(room_id, "fake_player", 100)
         assert result is False
 
+    def test_apply_batch_runs_mutators_and_stamps_activity_once(self):
+        """Test batched mutations are applied in order and return a snapshot."""
+        room_id = "batch_room"
+        player = self.room_manager.add_player_to_room(room_id, "Player1", "socket1")
+        before = self.room_manager.get_room_state(room_id)["last_activity"]
+
+        def set_score(room):
+            room["players"][player["player_id"]]["score"] = 10
+
+        def bump_score(room):
+            room["players"][player["player_id"]]["score"] += 5
+
+        snapshot = self.room_manager.apply_batch(room_id, [set_score, bump_score])
+
+        assert snapshot["players"][player["player_id"]]["score"] == 15
+        assert snapshot["last_activity"] >= before
+
+    def test_apply_batch_nonexistent_room(self):
+        """Test batching against a missing room returns None without running mutators."""
+        calls = []
+        result = self.room_manager.apply_batch("missing_room", [calls.append])
+        assert result is None
+        assert calls == []
+
 
 class TestRoomManagerRoomQueries:
     """Test cases for room query operations."""
@@ -510,6 +633,101 @@ class TestRoomManagerRoomQueries:
         assert room1 in available_rooms
         assert room3 in available_rooms
 
+    def test_find_available_room_index(self):
+        """Test the matchmaking index tracks players, phase and deletion."""
+        assert self.room_manager.find_available_room() is None
+
+        # Empty rooms are not offered
+        self.room_manager.create_room("empty_room")
+        assert self.room_manager.find_available_room() is None
+
+        player = self.room_manager.add_player_to_room("open_room", "Player1", "socket1")
+        assert self.room_manager.find_available_room() == "open_room"
+
+        # Full rooms are not offered
+        for i in range(8):
+            self.room_manager.add_player_to_room("full_room", f"Player{i}", f"socket{i}")
+        self.room_manager.remove_player_from_room("open_room", player["player_id"])
+        assert self.room_manager.find_available_room() is None
+
+        # Rooms that leave the waiting phase are not offered
+        self.room_manager.add_player_to_room("playing_room", "Player1", "socket1")
+        game_state = self.room_manager.get_room_state("playing_room")["game_state"].copy()
+        game_state["phase"] = "responding"
+        assert self.room_manager.update_game_state("playing_room", game_state)
+        assert self.room_manager.find_available_room() is None
+
+        self.room_manager.add_player_to_room("deleted_room", "Player1", "socket1")
+        self.room_manager.delete_room("deleted_room")
+        assert self.room_manager.find_available_room() is None
+
+    def test_find_available_room_skips_deleted_room(self):
+        """Test matchmaking never returns a room missing from the room registry."""
+        self.room_manager.add_player_to_room("ghost_room", "Player1", "socket1")
+        self.room_manager.add_player_to_room("open_room", "Player1", "socket2")
+
+        # Remove the room behind the index's back
+        del self.room_manager.lifecycle._rooms["ghost_room"]
+
+        assert self.room_manager.find_available_room() == "open_room"
+        assert "ghost_room" not in self.room_manager.lifecycle._available_rooms
+
+        # A join that read the room before it was deleted cannot re-list it either
+        room = self.room_manager.lifecycle.get_room_data("open_room")
+        self.room_manager.delete_room("open_room")
+        self.room_manager.lifecycle.update_room_indexes(room)
+        assert self.room_manager.find_available_room() is None
+
+    def test_get_expired_room_ids_reports_rooms_past_deadline(self):
+        """Test only rooms whose running phase timer has expired are reported."""
+        self.room_manager.add_player_to_room("idle_room", "Player1", "socket1")
+        self.room_manager.add_player_to_room("timed_room", "Player1", "socket1")
+        assert self.room_manager.get_expired_room_ids() == []
+
+        game_state = self.room_manager.get_room_state("timed_room")["game_state"].copy()
+        game_state.update(phase="responding", phase_start_time=datetime.now(), phase_duration=180)
+        self.room_manager.update_game_state("timed_room", game_state)
+        assert self.room_manager.get_expired_room_ids() == []
+
+        # An expired phase is reported on every check until the room moves on
+        game_state = game_state.copy()
+        game_state.update(phase_start_time=datetime.now() - timedelta(seconds=181))
+        self.room_manager.update_game_state("timed_room", game_state)
+        assert self.room_manager.get_expired_room_ids() == ["timed_room"]
+        assert self.room_manager.get_expired_room_ids() == ["timed_room"]
+
+        game_state = game_state.copy()
+        game_state.update(phase="waiting", phase_start_time=None, phase_duration=0)
+        self.room_manager.update_game_state("timed_room", game_state)
+        assert self.room_manager.get_expired_room_ids() == []
+
+    def test_update_room_indexes_ignores_deleted_room(self):
+        """Test a room deleted before its index refresh is not re-indexed."""
+        self.room_manager.add_player_to_room("timed_room", "Player1", "socket1")
+        room = self.room_manager.lifecycle.get_room_data("timed_room")
+        self.room_manager.delete_room("timed_room")
+
+        # A mutation that read the room before the delete refreshes its indexes after it
+        room["game_state"].update(phase="responding", phase_duration=180,
+                                  phase_start_time=datetime.now() - timedelta(seconds=181))
+        self.room_manager.lifecycle.update_room_indexes(room)
+
+        assert self.room_manager.get_expired_room_ids() == []
+
+    def test_get_expired_room_ids_drops_deleted_rooms(self):
+        """Test an expired deadline of a room deleted without cleanup is reported no more."""
+        self.room_manager.add_player_to_room("timed_room", "Player1", "socket1")
+        game_state = self.room_manager.get_room_state("timed_room")["game_state"].copy()
+        game_state.update(phase="responding", phase_duration=180,
+                          phase_start_time=datetime.now() - timedelta(seconds=181))
+        self.room_manager.update_game_state("timed_room", game_state)
+
+        # Remove the room behind the index's back
+        del self.room_manager.lifecycle._rooms["timed_room"]
+
+        assert self.room_manager.get_expired_room_ids() == []
+        assert self.room_manager.get_expired_room_ids() == []
+
     def test_find_room_by_criteria(self):
         """Test finding rooms by specific criteria."""
         # Create rooms with different states
@@ -543,13 +761,12 @@ class TestRoomManagerCleanupOperations:
 
     def test_cleanup_inactive_rooms(self):
         """Test cleanup of inactive rooms."""
-        # Create room and modify its last_activity to be old
+        # Create a room as if it had been created two hours ago
         old_room = "old_room"
-        self.room_manager.create_room(old_room)
-
-        # Manually set old timestamp (accessing internal state for testing)
         old_time = datetime.now() - timedelta(hours=2)
-        self.room_manager._rooms[old_room]["last_activity"] = old_time
+        with patch('src.services.room_lifecycle_service.datetime') as mock_datetime:
+            mock_datetime.now.return_value = old_time
+            self.room_manager.create_room(old_room)
 
         # Create a recent room
         new_room = "new_room"
@@ -407,8 +407,8 @@ class TestSocketEventRouterLogging:
 
         # Check logging calls
         mock_logger.info.assert_any_call("Handling event: logged_event from client: test_socket_logging")
-        mock_logger.debug.assert_any_call("Event data: test_data")
-        mock_logger.debug.assert_any_call("Successfully handled event: logged_event")
+        mock_logger.debug.assert_any_call("Event data: %s", "test_data")
+        mock_logger.debug.assert_any_call("Successfully handled event: %s", "logged_event")
 
     def test_error_logging(self):
         """Test that errors are properly logged"""